@@ -2,6 +2,7 @@
 Main converter class that orchestrates PDF parsing and LaTeX generation.
 """
 
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
@@ -23,7 +24,10 @@ class PDF2LaTeXConverter:
         Args:
             template: LaTeX document template (article, report, book)
             preserve_images: Whether to include images in the output
-            config: Additional configuration options
+            config: Additional configuration options, shared by the parser and
+                the generator. 'parse_workers' sets the processes PDFParser uses
+                to extract page text and 'max_workers' the processes LaTeXGenerator
+                uses to format pages; both default to 1.
         """
         self.template = template
         self.preserve_images = preserve_images
@@ -101,11 +105,17 @@ class PDF2LaTeXConverter:
         # Parse PDF
         document = self.parse_pdf(pdf_path)
         
-        # Generate LaTeX
-        latex_content = self.generate_latex(document)
-        
-        # Write output
-        output_path.write_text(latex_content, encoding='utf-8')
+        # Stream LaTeX into a temporary file next to the output and move it into place
+        # once complete, so a failed conversion leaves any existing output untouched
+        logger.info("Generating LaTeX code")
+        temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with temp_path.open('w', encoding='utf-8') as output_file:
+                self.latex_generator.generate_to(document, output_file)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
         
         logger.info(f"Conversion completed: {output_path}")
         
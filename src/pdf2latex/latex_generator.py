@@ -2,19 +2,215 @@
 LaTeX generation module for converting parsed PDF content to LaTeX source code.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, TextIO, Tuple
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+import io
 import re
 from loguru import logger
 from .math_processor import MathProcessor
 from .image_processor import ImageProcessor
 
 
+# A non-blank line without its surrounding whitespace
+_NONBLANK_LINE_RE = re.compile(r'\S(?:[^\n]*\S)?')
+
+# Text cleanup
+_TRAILING_SPACES_RE = re.compile(r'[ \t]+\n')
+_INNER_SPACES_RE = re.compile(r'([^\s])  +([^\s])')
+_EDGE_SEPARATORS_RE = re.compile(r'^[,\-\s]+|[,\-\s]+$')
+
+# Characters that need to be escaped in LaTeX text, applied in a single pass
+_LATEX_ESCAPES = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '^': r'\textasciicircum{}',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '²': r'\textasciicircum{}2',  # Unicode superscript 2
+    '³': r'\textasciicircum{}3',  # Unicode superscript 3
+})
+
+# Numbered headings like "1. Introduction" or "1.1 Background"
+_NUMBERED_SECTION = r'\d+(?:\.\d+)*\.?\s+[A-Z][a-z]'
+_NUMBERED_SUBSECTION = r'\d+\.\d+\.?\s+[A-Z]'
+_NUMBERED_SUBSECTION_RE = re.compile(_NUMBERED_SUBSECTION)
+
+# One anchored match tells which kind of numbered heading a line is; sections win
+_NUMBERED_HEADING_RE = re.compile(rf'(?P<section>{_NUMBERED_SECTION})|(?P<subsection>{_NUMBERED_SUBSECTION})')
+
+# Date formats recognised by _format_date
+_PDF_DATE_RE = re.compile(r'D:(\d{4})(\d{2})(\d{2})')
+_DATE_PREFIX_RE = re.compile(r'^(created:|updated:)\s*', re.IGNORECASE)
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_US_DATE_RE = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})')
+_MONTH_DAY_YEAR_RE = re.compile(r'[A-Za-z]+ \d{1,2},? \d{4}')
+_MONTH_YEAR_RE = re.compile(r'[A-Za-z]+ \d{4}')
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+
+# Abstract section - more flexible patterns. The heading must start near the top of the
+# first page; the abstract body may run past the window.
+_ABSTRACT_SEARCH_WINDOW = 4096
+_ABSTRACT_PATTERNS = [
+    re.compile(r'abstract\s*[:\-]?\s*\n(.+?)(?=\n\s*(?:introduction|overview|1\.|keywords|key words))',
+               re.DOTALL | re.IGNORECASE),
+    re.compile(r'abstract\s*[:\-]?\s*(.+?)(?=\n\s*(?:introduction|overview|1\.|keywords|key words))',
+               re.DOTALL | re.IGNORECASE),
+    re.compile(r'summary\s*[:\-]?\s*\n(.+?)(?=\n\s*(?:introduction|overview|1\.))',
+               re.DOTALL | re.IGNORECASE),
+]
+# Heading word each abstract pattern starts with, used to find its possible start positions
+_ABSTRACT_HEADING_RES = [re.compile(heading, re.IGNORECASE) for heading in ('abstract', 'abstract', 'summary')]
+
+# Common date patterns stripped from single-line metadata, applied one after another;
+# a later pattern may match text that only comes together once an earlier one is removed
+_MONTH_NAMES = 'January|February|March|April|May|June|July|August|September|October|November|December'
+_DATE_COMPONENT_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    rf'\b(?:{_MONTH_NAMES})\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}\b',
+    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',
+    r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',
+    rf'\b(?:{_MONTH_NAMES})\s+\d{{4}}\b',
+))
+
+# Equation rewrites in priority order; only the first rule that matches is applied
+_EQUATION_RECONSTRUCTIONS = [
+    # Drain current equation - ID = 1 2μnCox W L (VGS-Vth)²
+    # Should become: ID = (1/2)μnCox(W/L)(VGS-Vth)²
+    (re.compile(r'(I_\{D\})\s*=\s*1\s*2(\\mu_\{n\}\s*C_\{Cox\})\s*W\s*L\s*(\(V_\{G_\{S\}\}\s*[\-]\s*V_\{th\}\)\^?\{?2\}?)'),
+     r'\1 = \\frac{1}{2}\2 \\frac{W}{L}\3'),
+    # General pattern for "= 1 2μ" → "= (1/2)μ"
+    (re.compile(r'=\s*1\s*2(\\mu[^}]*\}?[^}]*\}?)'),
+     r'= \\frac{1}{2}\1'),
+    # W L pattern → W/L fraction
+    (re.compile(r'(\\frac\{1\}\{2\}[^}]*\}[^}]*\})\s*W\s*L\s*(\([^)]+\))'),
+     r'\1 \\frac{W}{L}\2'),
+]
+
+# Matches wherever any of the equation rewrites would apply
+_EQUATION_RECONSTRUCTION_RE = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern, _ in _EQUATION_RECONSTRUCTIONS)
+)
+
+# Math fragments kept verbatim by _escape_latex_preserving_math
+_PRESERVED_MATH_PATTERNS = [
+    re.compile(r'\\[a-zA-Z]+'),  # LaTeX commands like \mu, \frac, etc.
+    re.compile(r'\{[^}]*\}'),    # Braces with content
+    re.compile(r'\^{[^}]*}'),    # Superscripts
+    re.compile(r'_{[^}]*}'),     # Subscripts
+    re.compile(r'\\frac{[^}]*}{[^}]*}'),  # Fractions
+]
+
+# Placeholder standing in for a preserved math fragment while escaping
+_MATH_PLACEHOLDER_RE = re.compile(r'\x00(\d+)\x00')
+
+# Pages handed to a worker process at a time when pages are formatted in parallel
+_FORMAT_CHUNK_PAGES = 4
+
+
+def _classify_heading(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Classify a line as a section heading, a subsection heading, or body text.
+    
+    Args:
+        text: Stripped line of text
+        
+    Returns:
+        ('section' or 'subsection', heading text without trailing periods),
+        or None for body text
+    """
+    # Long lines are never headings; checking first keeps them out of the cache
+    if len(text) > 100:
+        return None
+    
+    return _classify_short_line(text)
+
+
+@lru_cache(maxsize=4096)
+def _classify_short_line(text: str) -> Optional[Tuple[str, str]]:
+    """Heading classification for text of at most 100 characters, memoized for repeated lines."""
+    # Be conservative - only mark obvious headings
+    
+    # Single letters or very short text are not headings
+    if len(text) < 3:
+        return None
+    
+    # Check for numbered sections (like "1. Introduction" or "1.1 Background");
+    # the leading-digit test skips the regex for ordinary body text
+    numbered = _NUMBERED_HEADING_RE.match(text) if text[0].isdigit() else None
+    if numbered and numbered.lastgroup == 'section':
+        return 'section', text.rstrip('.')
+    
+    # Headings have 2-8 words; this also rules out whitespace-padded fragments
+    words = len(text.split())
+    if words >= 2 and words <= 8:
+        # Check if it's all uppercase (common for headings)
+        if text.isupper():
+            return 'section', text.rstrip('.')
+        
+        # Check if it's title case, short, and substantive
+        if words >= 3 and words <= 6 and text.istitle():
+            return 'section', text.rstrip('.')
+    
+    # Numbered subsections are held to a shorter length than headings
+    if numbered and len(text) <= 80:
+        return 'subsection', text.rstrip('.')
+    
+    return None
+
+
+# Generator used by _format_page in a worker process
+_worker_generator = None
+
+
+def _init_format_worker(generator_class: type, template: str, config: Dict[str, Any]) -> None:
+    """
+    Create the generator a worker process formats its pages with.
+    
+    Args:
+        generator_class: LaTeXGenerator class (or subclass) to instantiate
+        template: LaTeX document template of the parent generator
+        config: Configuration options of the parent generator
+    """
+    global _worker_generator
+    _worker_generator = generator_class(template=template, preserve_images=False, config=config)
+
+
+def _format_page(text: str) -> str:
+    """
+    Format the text of one page in a worker process.
+    
+    Args:
+        text: Raw text of the page
+        
+    Returns:
+        Formatted LaTeX text
+    """
+    return _worker_generator._format_text(text)
+
+
+@dataclass
+class _DocCtx:
+    """Per-document values read once in generate() and shared by the section builders."""
+    pdf_path: Optional[Path]
+    metadata: Dict[str, Any]
+    pages: List[Dict[str, Any]]
+
+
 class LaTeXGenerator:
     """
     Generator that converts parsed PDF content to LaTeX source code.
     """
     
+    __slots__ = ('template', 'preserve_images', 'config', 'math_processor',
+                 'image_processor', 'templates', '_image_cache', '_preamble_prefix', 'max_workers')
+    
     def __init__(self, template: str = 'article', preserve_images: bool = True,
                  config: Optional[Dict[str, Any]] = None, output_dir: Optional[Path] = None):
         """
@@ -23,17 +219,24 @@ class LaTeXGenerator:
         Args:
             template: LaTeX document template (article, report, book)
             preserve_images: Whether to include images
-            config: Additional configuration options
+            config: Additional configuration options. 'max_workers' sets the
+                number of processes used to format page text (default 1).
             output_dir: Directory for image output
         """
         self.template = template
         self.preserve_images = preserve_images
         self.config = config or {}
         
+        # Processes used to format page text; 1 formats pages one after another
+        self.max_workers = self.config.get('max_workers', 1)
+        
         # Initialize processors
         self.math_processor = MathProcessor()
         self.image_processor = ImageProcessor(output_dir) if preserve_images else None
         
+        # Extracted images per resolved PDF path, stored with the file's mtime in nanoseconds
+        self._image_cache: Dict[str, Tuple[int, Dict[int, List[Dict]]]] = {}
+        
         # Template configurations
         self.templates = {
             'article': {
@@ -53,6 +256,11 @@ class LaTeXGenerator:
             }
         }
         
+        # Document class and packages only depend on the template, so build them once
+        self._preamble_prefix = self._build_preamble_prefix(
+            self.templates.get(template, self.templates['article'])
+        )
+        
         logger.info(f"Initialized LaTeXGenerator with template: {template}")
     
     def _normalize_unicode_characters(self, text: str) -> str:
@@ -83,31 +291,60 @@ class LaTeXGenerator:
         Returns:
             LaTeX source code
         """
-        logger.info("Generating LaTeX document")
-        
-        # Generate document parts
-        preamble = self._generate_preamble(document)
-        title_section = self._generate_title_section(document)
-        content = self._generate_content(document)
-        
-        # Combine into full document
-        latex_document = f"{preamble}\n\n{title_section}\n\n{content}\n\n\\end{{document}}"
+        buffer = io.StringIO()
+        self.generate_to(document, buffer)
+        latex_document = buffer.getvalue()
         
         logger.info(f"Generated LaTeX document ({len(latex_document)} characters)")
         return latex_document
     
-    def _generate_preamble(self, document: Dict[str, Any]) -> str:
+    def generate_to(self, document: Dict[str, Any], out: TextIO) -> None:
         """
-        Generate the LaTeX preamble (document class, packages, settings).
+        Generate LaTeX source code from parsed document, writing it to a stream.
+        
+        Content is written page by page, so the full document is never held in memory.
         
         Args:
             document: Parsed document structure
+            out: Text stream to write the LaTeX source to
+        """
+        logger.info("Generating LaTeX document")
+        
+        # Parsers store the path as a string; reuse it if a Path was passed in
+        pdf_path = document.get('pdf_path')
+        if pdf_path and not isinstance(pdf_path, Path):
+            pdf_path = Path(pdf_path)
+        
+        ctx = _DocCtx(
+            pdf_path=pdf_path or None,
+            metadata=document.get('metadata', {}),
+            pages=document.get('pages', [])
+        )
+        
+        # Write document parts separated by blank lines
+        out.write(self._generate_preamble(ctx))
+        out.write("\n\n")
+        out.write(self._generate_title_section(ctx))
+        out.write("\n\n")
+        
+        separator = ""
+        for part in self._iter_content(ctx):
+            out.write(separator)
+            out.write(part)
+            separator = "\n\n"
+        
+        out.write("\n\n\\end{document}")
+    
+    def _build_preamble_prefix(self, template_config: Dict[str, Any]) -> str:
+        """
+        Build the document class and package lines of the preamble.
+        
+        Args:
+            template_config: Template configuration
             
         Returns:
-            LaTeX preamble
+            Preamble lines that do not depend on the document
         """
-        template_config = self.templates.get(self.template, self.templates['article'])
-        
         preamble_parts = []
         
         # Document class
@@ -128,8 +365,22 @@ class LaTeXGenerator:
         if self.preserve_images:
             preamble_parts.append("\\usepackage{float}")  # For better image positioning
         
+        return '\n'.join(preamble_parts)
+    
+    def _generate_preamble(self, ctx: _DocCtx) -> str:
+        """
+        Generate the LaTeX preamble (document class, packages, settings).
+        
+        Args:
+            ctx: Per-document context built by generate()
+            
+        Returns:
+            LaTeX preamble
+        """
+        preamble_parts = [self._preamble_prefix]
+        
         # Title, author, and date from metadata
-        metadata = document.get('metadata', {})
+        metadata = ctx.metadata
         
         # Title
         if metadata.get('title'):
@@ -137,9 +388,8 @@ class LaTeXGenerator:
             preamble_parts.append(f"\\title{{{title}}}")
         else:
             # Use filename as fallback
-            pdf_path = document.get('pdf_path', '')
-            if pdf_path:
-                filename = Path(pdf_path).stem
+            if ctx.pdf_path:
+                filename = ctx.pdf_path.stem
                 preamble_parts.append(f"\\title{{{self._escape_latex(filename)}}}")
         
         # Author
@@ -163,17 +413,17 @@ class LaTeXGenerator:
         
         return '\n'.join(preamble_parts)
     
-    def _generate_title_section(self, document: Dict[str, Any]) -> str:
+    def _generate_title_section(self, ctx: _DocCtx) -> str:
         """
         Generate the title section if metadata is available.
         
         Args:
-            document: Parsed document structure
+            ctx: Per-document context built by generate()
             
         Returns:
             LaTeX title section
         """
-        metadata = document.get('metadata', {})
+        metadata = ctx.metadata
         
         # Always generate maketitle since we now ensure title is always set
         title_parts = ["\\maketitle"]
@@ -182,7 +432,7 @@ class LaTeXGenerator:
         structure = metadata.get('structure', {})
         if structure.get('has_abstract'):
             # Try to extract abstract from first page
-            abstract_text = self._extract_abstract(document)
+            abstract_text = self._find_abstract(ctx.pages)
             if abstract_text:
                 title_parts.append("")
                 title_parts.append("\\begin{abstract}")
@@ -191,79 +441,121 @@ class LaTeXGenerator:
         
         return '\n'.join(title_parts)
     
-    def _generate_content(self, document: Dict[str, Any]) -> str:
+    def _iter_content(self, ctx: _DocCtx) -> Iterator[str]:
         """
-        Generate the main document content.
+        Generate the main document content, one block at a time.
         
         Args:
-            document: Parsed document structure
+            ctx: Per-document context built by generate()
             
-        Returns:
-            LaTeX document content
+        Yields:
+            LaTeX content blocks, to be separated by blank lines
         """
-        content_parts = []
-        
-        pages = document.get('pages', [])
+        has_content = False
         
         # Extract images if image processor is available
         extracted_images = {}
         if self.preserve_images and self.image_processor:
             try:
                 # Get images from document data or extract from PDF
-                pdf_path = document.get('pdf_path')
-                if pdf_path:
-                    extracted_images = self.image_processor.extract_all_images(Path(pdf_path))
+                if ctx.pdf_path:
+                    extracted_images = self._get_extracted_images(ctx.pdf_path)
             except Exception as e:
                 logger.warning(f"Failed to extract images: {e}")
         
-        # Process each page
-        for page_num, page in enumerate(pages, 1):
-            logger.debug(f"Processing page {page_num}")
-            
-            page_content = []
-            
-            # Process text content
-            page_text = page.get('text', '')
-            if page_text.strip():
-                # Remove metadata content from the first page to avoid duplication
-                if page_num == 1:
-                    page_text = self._remove_metadata_from_text(page_text, document.get('metadata', {}))
+        # Bind per-page helpers once outside the loop
+        format_text = self._format_text
+        image_processor = self.image_processor
+        
+        # Page text, with metadata removed from the first page to avoid duplication
+        page_texts = [page.get('text', '') for page in ctx.pages]
+        if page_texts and page_texts[0] and not page_texts[0].isspace():
+            page_texts[0] = self._remove_metadata_from_text(page_texts[0], ctx.metadata)
+        
+        # Format pages in order, optionally spreading the work over worker processes.
+        # Formatting is pure Python under the GIL, so threads would not run it in parallel;
+        # the math processor's pattern tables cannot be pickled, so each worker builds its own generator.
+        workers = min(self.max_workers, len(page_texts))
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_format_worker,
+                                           initargs=(type(self), self.template, self.config))
+            formatted_pages = executor.map(_format_page, page_texts, chunksize=_FORMAT_CHUNK_PAGES)
+        else:
+            executor = None
+            formatted_pages = map(format_text, page_texts)
+        
+        try:
+            # Process each page
+            for page_num, (page_text, formatted_text) in enumerate(zip(page_texts, formatted_pages), 1):
+                logger.debug(f"Processing page {page_num}")
+                
+                # Add page break before every page after the first
+                if page_num > 1 and has_content:
+                    yield "\\newpage"
+                
+                page_content = []
                 
-                formatted_text = self._format_text(page_text)
-                if formatted_text.strip():
+                # Process text content
+                if formatted_text:
                     page_content.append(formatted_text)
-            
-            # Process images for this page
-            if self.preserve_images and page_num in extracted_images:
-                page_images = extracted_images[page_num]
-                for img_info in page_images:
-                    # Analyze image placement
-                    analysis = self.image_processor.analyze_image_placement(img_info, page_text)
-                    
-                    if analysis['is_likely_figure']:
-                        # Generate figure environment
-                        caption = f"Figure from page {page_num}"
-                        figure_latex = self.image_processor.generate_latex_figure(
-                            img_info, 
-                            caption=caption,
-                            width_ratio=analysis['width_suggestion'],
-                            placement=analysis['placement_suggestion']
-                        )
-                        page_content.append(figure_latex)
-                    elif analysis['is_likely_inline']:
-                        # Generate inline image
-                        inline_latex = self.image_processor.generate_inline_image(img_info)
-                        page_content.append(inline_latex)
-            
-            # Add processed page content
-            if page_content:
-                content_parts.extend(page_content)
-            
-            # Add page break between pages (except for the last page)
-            if page_num < len(pages) and content_parts:
-                content_parts.append("\\newpage")
+                
+                # Process images for this page
+                page_images = extracted_images.get(page_num)
+                if page_images:
+                    for img_info in page_images:
+                        # Analyze image placement
+                        analysis = image_processor.analyze_image_placement(img_info, page_text)
+                        
+                        if analysis['is_likely_figure']:
+                            # Generate figure environment
+                            caption = f"Figure from page {page_num}"
+                            figure_latex = image_processor.generate_latex_figure(
+                                img_info, 
+                                caption=caption,
+                                width_ratio=analysis['width_suggestion'],
+                                placement=analysis['placement_suggestion']
+                            )
+                            page_content.append(figure_latex)
+                        elif analysis['is_likely_inline']:
+                            # Generate inline image
+                            inline_latex = image_processor.generate_inline_image(img_info)
+                            page_content.append(inline_latex)
+                
+                # Add processed page content
+                if page_content:
+                    has_content = True
+                    yield from page_content
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    
+    def _get_extracted_images(self, pdf_path: Path) -> Dict[int, List[Dict]]:
+        """
+        Extract images from a PDF, reusing earlier results for an unchanged file.
         
-        return '\n\n'.join(content_parts)
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Dictionary mapping page numbers to lists of image info
+        """
+        try:
+            key = str(pdf_path.resolve())
+            mtime_ns = pdf_path.stat().st_mtime_ns
+        except OSError as e:
+            # Without a stable key, fall back to extracting without caching
+            logger.debug(f"Not caching images for {pdf_path}: {e}")
+            return self.image_processor.extract_all_images(pdf_path)
+        
+        cached = self._image_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            logger.debug(f"Reusing extracted images for {pdf_path}")
+            return cached[1]
+        
+        extracted_images = self.image_processor.extract_all_images(pdf_path)
+        # Keyed by path alone so a modified file replaces its stale entry
+        self._image_cache[key] = (mtime_ns, extracted_images)
+        return extracted_images
     
     def _format_text(self, text: str) -> str:
         """
@@ -275,7 +567,7 @@ class LaTeXGenerator:
         Returns:
             Formatted LaTeX text
         """
-        if not text.strip():
+        if not text or text.isspace():
             return ""
         
         # Normalize Unicode characters first
@@ -284,17 +576,86 @@ class LaTeXGenerator:
         # Clean up problematic line breaks and excessive spaces
         text = self._clean_text_formatting(text)
         
-        # Split into paragraphs and process each one
-        # (math processing happens within _process_paragraph_with_equations)
-        paragraphs = text.split('\n\n')
-        formatted_paragraphs = []
+        # Walk the non-blank lines of the cleaned text once, treating blank
+        # lines as paragraph boundaries and classifying each line as it is reached
+        result_lines = []
+        math_group = []
+        in_equation = False
+        previous_end = 0
+        
+        # Text lines awaiting escaping, as (output index, sectioning command or None)
+        pending_escapes = []
+        
+        # Bind per-line helpers once outside the loop
+        is_likely_math_line = self.math_processor.is_likely_math_line
+        convert_to_latex = self.math_processor.convert_to_latex
+        classify_heading = _classify_heading
+        
+        for match in _NONBLANK_LINE_RE.finditer(text):
+            line = match.group()
+            
+            # More than one newline since the previous line means a blank line
+            if text.count('\n', previous_end, match.start()) > 1:
+                # Paragraph boundary - finalize any pending math group
+                if math_group:
+                    self._append_math_group(math_group, result_lines)
+                    math_group = []
+                    in_equation = False
+                
+                # Separate paragraphs by a blank line
+                if result_lines:
+                    result_lines.append('')
+            previous_end = match.end()
+            
+            # Pattern like "(1)"
+            is_equation_number = line.startswith('(') and line.endswith(')') and line[1:-1].isdecimal()
+            is_math = not is_equation_number and is_likely_math_line(line)
+            
+            if is_math:
+                # This is a mathematical line - convert to LaTeX but don't escape
+                math_line = convert_to_latex(line)
+                math_group.append(math_line)
+                in_equation = True
+            elif is_equation_number and in_equation:
+                # This is equation numbering - close the current group
+                raw_content = ' '.join(math_group)
+                equation_content = self._reconstruct_equation(raw_content)
+                equation_number = line.strip('()')  # Extract number
+                result_lines.append(f"\\begin{{equation}}")
+                result_lines.append(equation_content)
+                result_lines.append(f"\\label{{eq:{equation_number}}}")
+                result_lines.append(f"\\end{{equation}}")
+                math_group = []
+                in_equation = False
+            else:
+                # Not a math line - finalize any pending math group
+                if math_group:
+                    self._append_math_group(math_group, result_lines)
+                    math_group = []
+                    in_equation = False
+                
+                # Process the current non-math line (escaped below)
+                heading = classify_heading(line)
+                if heading:
+                    command, line = heading
+                else:
+                    command = None
+                pending_escapes.append((len(result_lines), command))
+                result_lines.append(line)
+        
+        # Handle any remaining math group at the end
+        if math_group:
+            self._append_math_group(math_group, result_lines)
         
-        for paragraph in paragraphs:
-            formatted_paragraph = self._process_paragraph_with_equations(paragraph)
-            if formatted_paragraph:
-                formatted_paragraphs.append(formatted_paragraph)
+        # Escape all text lines in one call; lines never contain newlines
+        if pending_escapes:
+            escaped_lines = self._escape_latex(
+                '\n'.join(result_lines[index] for index, _ in pending_escapes)
+            ).split('\n')
+            for (index, command), escaped_line in zip(pending_escapes, escaped_lines):
+                result_lines[index] = f"\\{command}{{{escaped_line}}}" if command else escaped_line
         
-        return '\n\n'.join(formatted_paragraphs)
+        return '\n'.join(result_lines)
     
     def _clean_text_formatting(self, text: str) -> str:
         """
@@ -307,7 +668,7 @@ class LaTeXGenerator:
             Cleaned text with better line breaks and spacing
         """
         # Remove excessive trailing spaces before line breaks
-        text = re.sub(r'[ \t]+\n', '\n', text)
+        text = _TRAILING_SPACES_RE.sub('\n', text)
         
         # Fix lines that break mid-word or mid-sentence without hyphenation
         # Join lines that end without punctuation and continue with lowercase
@@ -336,91 +697,26 @@ class LaTeXGenerator:
         text = '\n'.join(cleaned_lines)
         
         # Remove excessive spaces in the middle of lines (but preserve indentation)
-        text = re.sub(r'([^\s])  +([^\s])', r'\1 \2', text)
+        text = _INNER_SPACES_RE.sub(r'\1 \2', text)
         
         return text
     
-    def _process_paragraph_with_equations(self, paragraph: str) -> str:
+    def _append_math_group(self, math_group: List[str], result_lines: List[str]) -> None:
         """
-        Process a paragraph that might contain multi-line equations.
+        Finalize a group of consecutive math lines into a display environment.
         
         Args:
-            paragraph: Raw paragraph text
-            
-        Returns:
-            Formatted paragraph with proper equation environments
+            math_group: Converted math lines belonging to one expression
+            result_lines: Output lines to append the environment to
         """
-        if not paragraph.strip():
-            return ""
-        
-        # Split into individual lines
-        lines = [line.strip() for line in paragraph.split('\n') if line.strip()]
-        
-        result_lines = []
-        math_group = []
-        in_equation = False
-        
-        for line in lines:
-            is_math = self.math_processor.is_likely_math_line(line)
-            is_equation_number = re.match(r'^\(\d+\)$', line.strip())  # Pattern like "(1)"
-            
-            if is_math and not is_equation_number:
-                # This is a mathematical line - convert to LaTeX but don't escape
-                math_line = self.math_processor.convert_to_latex(line)
-                math_group.append(math_line)
-                in_equation = True
-            elif is_equation_number and in_equation:
-                # This is equation numbering - add it to the current group
-                math_group.append(line)
-                # End the equation group
-                raw_content = ' '.join(math_group[:-1])  # All but the number
-                equation_content = self._reconstruct_equation(raw_content)
-                equation_number = math_group[-1].strip('()')  # Extract number
-                result_lines.append(f"\\begin{{equation}}")
-                result_lines.append(equation_content)
-                result_lines.append(f"\\label{{eq:{equation_number}}}")
-                result_lines.append(f"\\end{{equation}}")
-                math_group = []
-                in_equation = False
-            else:
-                # Not a math line - finalize any pending math group
-                if math_group:
-                    if len(math_group) == 1:
-                        result_lines.append(f"\\[{math_group[0]}\\]")
-                    elif len(math_group) > 1:
-                        raw_content = ' '.join(math_group)
-                        equation_content = self._reconstruct_equation(raw_content)
-                        result_lines.append(f"\\begin{{align}}")
-                        result_lines.append(equation_content)
-                        result_lines.append(f"\\end{{align}}")
-                    math_group = []
-                    in_equation = False
-                
-                # Process the current non-math line
-                if self._looks_like_heading(line):
-                    heading_text = line.rstrip('.')
-                    escaped_heading = self._escape_latex(heading_text)
-                    result_lines.append(f"\\section{{{escaped_heading}}}")
-                elif self._looks_like_subheading(line):
-                    heading_text = line.rstrip('.')
-                    escaped_heading = self._escape_latex(heading_text)
-                    result_lines.append(f"\\subsection{{{escaped_heading}}}")
-                else:
-                    escaped_line = self._escape_latex(line)
-                    result_lines.append(escaped_line)
-        
-        # Handle any remaining math group at the end
-        if math_group:
-            if len(math_group) == 1:
-                result_lines.append(f"\\[{math_group[0]}\\]")
-            elif len(math_group) > 1:
-                raw_content = ' '.join(math_group)
-                equation_content = self._reconstruct_equation(raw_content)
-                result_lines.append(f"\\begin{{align}}")
-                result_lines.append(equation_content)
-                result_lines.append(f"\\end{{align}}")
-        
-        return '\n'.join(result_lines) if result_lines else ""
+        if len(math_group) == 1:
+            result_lines.append(f"\\[{math_group[0]}\\]")
+        else:
+            raw_content = ' '.join(math_group)
+            equation_content = self._reconstruct_equation(raw_content)
+            result_lines.append(f"\\begin{{align}}")
+            result_lines.append(equation_content)
+            result_lines.append(f"\\end{{align}}")
     
     def _reconstruct_equation(self, raw_content: str) -> str:
         """
@@ -432,42 +728,15 @@ class LaTeXGenerator:
         Returns:
             Reconstructed equation with proper mathematical formatting
         """
-        import re
-        
-        # Pattern 1: Drain current equation - ID = 1 2μnCox W L (VGS-Vth)²
-        # Should become: ID = (1/2)μnCox(W/L)(VGS-Vth)²
-        drain_current_pattern = r'(I_\{D\})\s*=\s*1\s*2(\\mu_\{n\}\s*C_\{Cox\})\s*W\s*L\s*(\(V_\{G_\{S\}\}\s*[\-]\s*V_\{th\}\)\^?\{?2\}?)'
-        
-        if re.search(drain_current_pattern, raw_content):
-            # Reconstruct drain current equation
-            reconstructed = re.sub(
-                drain_current_pattern,
-                r'\1 = \\frac{1}{2}\2 \\frac{W}{L}\3',
-                raw_content
-            )
-            return reconstructed
-        
-        # Pattern 2: General pattern for "= 1 2μ" → "= (1/2)μ"
-        fraction_pattern = r'=\s*1\s*2(\\mu[^}]*\}?[^}]*\}?)'
-        if re.search(fraction_pattern, raw_content):
-            reconstructed = re.sub(
-                fraction_pattern,
-                r'= \\frac{1}{2}\1',
-                raw_content
-            )
-            return reconstructed
-        
-        # Pattern 3: W L pattern → W/L fraction
-        wl_pattern = r'(\\frac\{1\}\{2\}[^}]*\}[^}]*\})\s*W\s*L\s*(\([^)]+\))'
-        if re.search(wl_pattern, raw_content):
-            reconstructed = re.sub(
-                wl_pattern,
-                r'\1 \\frac{W}{L}\2',
-                raw_content
-            )
-            return reconstructed
-        
-        # Return original if no patterns match
+        # Most content matches none of the rewrites - rule that out in one scan
+        if not _EQUATION_RECONSTRUCTION_RE.search(raw_content):
+            return raw_content
+        
+        for pattern, replacement in _EQUATION_RECONSTRUCTIONS:
+            reconstructed, count = pattern.subn(replacement, raw_content)
+            if count:
+                return reconstructed
+        
         return raw_content
     
     def _looks_like_heading(self, text: str) -> bool:
@@ -480,28 +749,8 @@ class LaTeXGenerator:
         Returns:
             True if text looks like a heading
         """
-        # Be conservative - only mark obvious headings
-        
-        if len(text) > 100 or len(text) < 3:
-            return False
-        
-        # Single letters or very short text are not headings
-        if len(text.strip()) <= 2:
-            return False
-        
-        # Check if it's all uppercase (common for headings) and has multiple words
-        if text.isupper() and len(text.split()) >= 2 and len(text.split()) <= 8:
-            return True
-        
-        # Check if it's title case, short, and substantive
-        if text.istitle() and len(text.split()) >= 3 and len(text.split()) <= 6:
-            return True
-        
-        # Check for numbered sections (like "1. Introduction" or "1.1 Background")
-        if re.match(r'^\d+(\.\d+)*\.?\s+[A-Z][a-z]', text):
-            return True
-        
-        return False
+        heading = _classify_heading(text)
+        return heading is not None and heading[0] == 'section'
     
     def _looks_like_subheading(self, text: str) -> bool:
         """
@@ -518,10 +767,7 @@ class LaTeXGenerator:
             return False
         
         # Check for numbered subsections
-        if re.match(r'^\d+\.\d+\.?\s+[A-Z]', text):
-            return True
-        
-        return False
+        return text[:1].isdigit() and _NUMBERED_SUBSECTION_RE.match(text) is not None
     
     def _escape_latex(self, text: str) -> str:
         """
@@ -533,28 +779,7 @@ class LaTeXGenerator:
         Returns:
             Escaped text
         """
-        # Handle backslash first to avoid conflicts
-        result = text.replace('\\', r'\textbackslash{}')
-        
-        # Dictionary of other characters that need to be escaped in LaTeX
-        latex_special_chars = {
-            '&': r'\&',
-            '%': r'\%',
-            '$': r'\$',
-            '#': r'\#',
-            '^': r'\textasciicircum{}',
-            '_': r'\_',
-            '{': r'\{',
-            '}': r'\}',
-            '~': r'\textasciitilde{}',
-            '²': r'\textasciicircum{}2',  # Unicode superscript 2
-            '³': r'\textasciicircum{}3',  # Unicode superscript 3
-        }
-        
-        for char, escaped in latex_special_chars.items():
-            result = result.replace(char, escaped)
-        
-        return result
+        return text.translate(_LATEX_ESCAPES)
     
     def _format_date(self, date_str: str) -> Optional[str]:
         """
@@ -573,35 +798,35 @@ class LaTeXGenerator:
         date_str = str(date_str).strip()
         
         # Handle PDF creation date format (D:YYYYMMDDHHmmSS) first
-        pdf_date_match = re.match(r'D:(\d{4})(\d{2})(\d{2})', date_str)
+        pdf_date_match = _PDF_DATE_RE.match(date_str)
         if pdf_date_match:
             year, month, day = pdf_date_match.groups()
             return f"{day}/{month}/{year}"
         
         # Remove common prefixes after checking for PDF format
-        date_str = re.sub(r'^(created:|updated:)\s*', '', date_str, flags=re.IGNORECASE)
+        date_str = _DATE_PREFIX_RE.sub('', date_str)
         
         # Handle ISO format (YYYY-MM-DD)
-        iso_match = re.match(r'(\d{4})-(\d{2})-(\d{2})', date_str)
+        iso_match = _ISO_DATE_RE.match(date_str)
         if iso_match:
             year, month, day = iso_match.groups()
             return f"{day}/{month}/{year}"
         
         # Handle US format (MM/DD/YYYY)
-        us_match = re.match(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', date_str)
+        us_match = _US_DATE_RE.match(date_str)
         if us_match:
             return date_str  # Keep as-is
         
         # Handle full date strings like "January 15, 2024" - keep as-is if they look complete
-        if re.match(r'[A-Za-z]+ \d{1,2},? \d{4}', date_str):
+        if _MONTH_DAY_YEAR_RE.match(date_str):
             return date_str
         
         # Handle month year format like "March 2024" - keep as-is
-        if re.match(r'[A-Za-z]+ \d{4}', date_str):
+        if _MONTH_YEAR_RE.match(date_str):
             return date_str
         
         # Handle year only (fallback)
-        year_match = re.search(r'\b(\d{4})\b', date_str)
+        year_match = _YEAR_RE.search(date_str)
         if year_match:
             return year_match.group(1)
         
@@ -615,29 +840,47 @@ class LaTeXGenerator:
         Args:
             document: Parsed document structure
             
+        Returns:
+            Abstract text or None
+        """
+        return self._find_abstract(document.get('pages', []))
+    
+    def _find_abstract(self, pages: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Extract abstract text from the first of the given pages.
+        
+        Args:
+            pages: Parsed pages of the document
+            
         Returns:
             Abstract text or None
         """
         # Get first page text
-        pages = document.get('pages', [])
         if not pages:
             return None
         
         first_page_text = pages[0].get('text', '')
         
-        # Look for abstract section - more flexible patterns
-        abstract_patterns = [
-            r'(?i)abstract\s*[:\-]?\s*\n(.+?)(?=\n\s*(?:introduction|overview|1\.|keywords|key words))',
-            r'(?i)abstract\s*[:\-]?\s*(.+?)(?=\n\s*(?:introduction|overview|1\.|keywords|key words))',
-            r'(?i)summary\s*[:\-]?\s*\n(.+?)(?=\n\s*(?:introduction|overview|1\.))',
-        ]
+        # Skip the case-insensitive DOTALL scans when neither keyword starts near the top;
+        # casefold() agrees with IGNORECASE matching where lower() does not
+        folded = first_page_text[:_ABSTRACT_SEARCH_WINDOW + len('abstract')].casefold()
+        if 'abstract' not in folded and 'summary' not in folded:
+            return None
         
-        for pattern in abstract_patterns:
-            match = re.search(pattern, first_page_text, re.DOTALL)
+        # Look for abstract section
+        for heading_re, pattern in zip(_ABSTRACT_HEADING_RES, _ABSTRACT_PATTERNS):
+            # Try the pattern only where its heading starts inside the window, so the
+            # match may end anywhere on the page
+            heading_end = _ABSTRACT_SEARCH_WINDOW + len(heading_re.pattern) - 1
+            match = None
+            for heading in heading_re.finditer(first_page_text, 0, heading_end):
+                match = pattern.match(first_page_text, heading.start())
+                if match:
+                    break
+            
             if match:
-                abstract_text = match.group(1).strip()
                 # Clean up the abstract text
-                abstract_text = re.sub(r'\s+', ' ', abstract_text)  # Normalize whitespace
+                abstract_text = ' '.join(match.group(1).split())  # Normalize whitespace
                 abstract_text = abstract_text[:1000]  # Limit length
                 
                 if len(abstract_text) > 50:  # Ensure it's substantial
@@ -655,36 +898,26 @@ class LaTeXGenerator:
         Returns:
             Escaped text with math commands preserved
         """
-        import uuid
+        placeholders = []
         
-        # Find and temporarily replace math commands with placeholders
-        math_patterns = [
-            r'\\[a-zA-Z]+',  # LaTeX commands like \mu, \frac, etc.
-            r'\{[^}]*\}',    # Braces with content
-            r'\^{[^}]*}',    # Superscripts
-            r'_{[^}]*}',     # Subscripts
-            r'\\frac{[^}]*}{[^}]*}',  # Fractions
-        ]
+        def mask(match: re.Match) -> str:
+            placeholders.append(match.group())
+            return f"\x00{len(placeholders) - 1}\x00"
         
-        placeholders = {}
-        result = text
+        def unmask(match: re.Match) -> str:
+            # Earlier placeholders can be nested inside later ones
+            return _MATH_PLACEHOLDER_RE.sub(unmask, placeholders[int(match.group(1))])
         
-        # Replace math patterns with unique placeholders
-        for pattern in math_patterns:
-            matches = re.finditer(pattern, result)
-            for match in reversed(list(matches)):  # Reverse to maintain indices
-                placeholder = f"__MATH_PLACEHOLDER_{uuid.uuid4().hex[:8]}__"
-                placeholders[placeholder] = match.group()
-                result = result[:match.start()] + placeholder + result[match.end():]
+        # Replace math patterns with indexed placeholders that survive escaping
+        result = text
+        for pattern in _PRESERVED_MATH_PATTERNS:
+            result = pattern.sub(mask, result)
         
         # Escape the remaining text
         result = self._escape_latex(result)
         
-        # Restore math commands
-        for placeholder, original in placeholders.items():
-            result = result.replace(placeholder, original)
-        
-        return result
+        # Restore math commands in a single pass
+        return _MATH_PLACEHOLDER_RE.sub(unmask, result)
     
     def _remove_metadata_from_text(self, text: str, metadata: Dict[str, Any]) -> str:
         """
@@ -709,61 +942,60 @@ class LaTeXGenerator:
         if '\n' not in text.strip():
             return self._filter_single_line_metadata(text, title, author, date)
         
-        # Handle multi-line format
-        lines = text.split('\n')
-        filtered_lines = []
+        # Handle multi-line format in one pass, dropping metadata lines,
+        # leading empty lines and runs of consecutive empty lines
+        result_lines = []
+        prev_empty = False
         
-        for line in lines:
+        for line in text.split('\n'):
             line_stripped = line.strip()
             
-            # Skip empty lines at the beginning (they'll be added back if needed)
             if not line_stripped:
-                # Only add empty lines if we already have content
-                if filtered_lines:
-                    filtered_lines.append(line)
+                # Only keep an empty line after content and not after another empty line
+                if result_lines and not prev_empty:
+                    result_lines.append(line)
+                    prev_empty = True
                 continue
             
             # Skip lines that match extracted metadata
-            skip_line = False
-            
-            # Check if line matches title
-            if title and (line_stripped == title or line_stripped.startswith(title)):
-                skip_line = True
-            
-            # Check if line matches author
-            elif author and (line_stripped == author or author in line_stripped):
-                # Be more careful with author matching - check if it's a standalone line
-                if len(line_stripped) < 100 and author in line_stripped:
-                    skip_line = True
-            
-            # Check if line matches date patterns
-            elif date and date in line_stripped:
-                skip_line = True
-            
-            # Also skip lines that are just the author and date combined
-            elif author and date and author in line_stripped and date in line_stripped:
-                skip_line = True
+            if self._is_metadata_line(line_stripped, title, author, date):
+                continue
             
-            if not skip_line:
-                filtered_lines.append(line)
+            result_lines.append(line)
+            prev_empty = False
         
-        # Clean up multiple consecutive empty lines
-        result_lines = []
-        prev_empty = False
-        
-        for line in filtered_lines:
-            is_empty = not line.strip()
-            if not (is_empty and prev_empty):  # Don't add consecutive empty lines
-                result_lines.append(line)
-            prev_empty = is_empty
-        
-        # Remove leading and trailing empty lines
-        while result_lines and not result_lines[0].strip():
-            result_lines.pop(0)
-        while result_lines and not result_lines[-1].strip():
+        # Remove the trailing empty line
+        if prev_empty:
             result_lines.pop()
         
         return '\n'.join(result_lines)
+    
+    def _is_metadata_line(self, line: str, title: str, author: str, date: str) -> bool:
+        """
+        Check whether a stripped line repeats extracted metadata.
+        
+        Args:
+            line: Stripped line of text
+            title: Extracted title
+            author: Extracted author
+            date: Extracted date
+            
+        Returns:
+            True if the line should be removed from the document body
+        """
+        # Check if line matches title
+        if title and line.startswith(title):
+            return True
+        
+        # Be more careful with author matching - only standalone lines
+        if author and author in line:
+            return len(line) < 100
+        
+        # Check if line matches date patterns
+        if date and date in line:
+            return True
+        
+        return False
 
     def _filter_single_line_metadata(self, text: str, title: str, author: str, date: str) -> str:
         """
@@ -780,36 +1012,24 @@ class LaTeXGenerator:
         """
         result = text.strip()
         
-        # Remove metadata components in order from start of line
-        if title and result.startswith(title):
-            result = result[len(title):].strip()
-        
-        if author and result.startswith(author):
-            result = result[len(author):].strip()
+        # Remove metadata components in order from start of line; the end is already trimmed
+        for prefix in (title, author):
+            if prefix and result.startswith(prefix):
+                result = result[len(prefix):].lstrip()
         
         # Remove date patterns
         if date:
             # Try exact match first
             if date in result:
-                result = result.replace(date, '', 1).strip()
+                result = result.replace(date, '', 1)
             else:
                 # Try removing date components
-                # Remove common date patterns
-                date_patterns = [
-                    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b',
-                    r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',
-                    r'\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b',
-                    r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\b',
-                ]
-                
-                for pattern in date_patterns:
-                    result = re.sub(pattern, '', result, flags=re.IGNORECASE).strip()
-        
-        # Clean up extra whitespace and common separators
-        result = re.sub(r'\s+', ' ', result)
-        result = re.sub(r'^[,\-\s]+|[,\-\s]+$', '', result)
+                for date_re in _DATE_COMPONENT_RES:
+                    result = date_re.sub('', result)
         
-        return result.strip()
+        # Clean up extra whitespace and common separators; this also trims both ends
+        result = ' '.join(result.split())
+        return _EDGE_SEPARATORS_RE.sub('', result)
 
     def _generate_image_inclusion(self, image_info: Dict[str, Any], page_num: int) -> str:
         """
@@ -4,10 +4,176 @@ Handles various mathematical notations and converts them to proper LaTeX math co
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple, Optional
 from loguru import logger
 
 
+# Unicode superscript and subscript characters mapped to their normal forms
+_SUPERSCRIPT_TABLE = str.maketrans({
+    '⁰': '0', '¹': '1', '²': '2', '³': '3', '⁴': '4', '⁵': '5',
+    '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9', '⁺': '+', '⁻': '-'
+})
+_SUBSCRIPT_TABLE = str.maketrans({
+    '₀': '0', '₁': '1', '₂': '2', '₃': '3', '₄': '4', '₅': '5',
+    '₆': '6', '₇': '7', '₈': '8', '₉': '9', '₊': '+', '₋': '-'
+})
+
+# Anything at least one conversion pattern or Greek letter needs; lines without it are left alone
+_MATH_TRIGGER_RE = re.compile(
+    r'[\^_/√±∓×÷≤≥≠≈∞∑∏∫∂∇∆→←²³¹⁰⁴-⁹⁺⁻₀-₉₊₋µα-ωΑ-Ω]'
+    r'|\)[0-9]'
+    r'|(?:sin|cos|tan|log|ln|exp)\('
+)
+
+# Only lines shorter than this are memoized by convert_to_latex
+_CONVERT_CACHE_MAX_LENGTH = 256
+
+# Joins lines for convert_many; a Unicode noncharacter that no conversion pattern can match
+_LINE_SEPARATOR = '\uffff'
+
+# Lines handed to each worker process by convert_many_parallel
+_PARALLEL_CHUNK_SIZE = 512
+
+# Every rule that can classify a line as math needs one of these characters
+_MATH_LINE_HINT_RE = re.compile(r'[(\\=+\-*/^_∑∏∫∂∇×÷±∓≤≥≠≈∞]')
+
+# Common English words; a line with two or more different ones is prose.
+# Lines are split into whole words once and looked up in the set.
+_COMMON_WORDS = frozenset([
+    'the', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'with', 'is', 'are', 'was', 'were',
+    'find', 'determine', 'calculate', 'draw', 'assume', 'given', 'take', 'consider',
+    'exam', 'comprehensive', 'semester', 'first', 'second', 'open', 'book', 'marks'
+])
+_WORD_RE = re.compile(r'\w+')
+
+# Three lowercase words in a row, as in a sentence
+_SENTENCE_RE = re.compile(r'[a-z]+\s+[a-z]+\s+[a-z]+')
+
+# Obvious non-mathematical contexts
+_NON_MATH_CONTEXT_RE = re.compile(r'(?:section|chapter|version|figure|table|page|marks|semester|exam)\s')
+
+# Strong mathematical indicators; any one of them marks a line as math, so they are searched together
+_STRONG_MATH_INDICATORS = [
+    r'[∑∏∫∂∇]',        # Strong mathematical symbols (removed ∆ as it appears in text)
+    r'√\([^)]+\)',       # Square root with parentheses
+    r'\b(sin|cos|tan|log|ln|exp|sinc)\s*\(',  # Mathematical functions with parentheses
+    r'\\(frac|sqrt|int|sum|prod)',  # LaTeX math commands
+    r'[a-z]\s*=\s*[0-9]+\s*[+\-\*/]',  # Simple equations like x = 2 + 3
+    r'[a-zA-Z]\(t\)\s*=',  # Functions of time like m(t) =
+    r'^\s*\([a-z]\)\s',  # Question numbers like "(a)" at start
+    r'\d+\s*[×÷±∓]\s*\d+',  # Arithmetic with special operators
+    r'[≤≥≠≈∞]',  # Mathematical comparison operators
+    r'\^\s*\{[^}]+\}',  # Explicit superscript in LaTeX format
+    r'_\s*\{[^}]+\}',  # Explicit subscript in LaTeX format
+]
+_STRONG_MATH_RE = re.compile('|'.join(f'(?:{indicator})' for indicator in _STRONG_MATH_INDICATORS))
+
+# Equations with = and mathematical operators, unless the text talks about equality
+_EQUATION_RE = re.compile(r'\b[a-zA-Z][a-zA-Z0-9]*\s*=\s*[^,]+[+\-\*/\^]')
+_EQUALITY_WORDS_RE = re.compile(r'\b(equal|equals|set)\b')
+
+# Very short lines made of symbols
+_MATH_SYMBOL_RE = re.compile(r'[=+\-\*/\^]')
+_LONG_WORD_RE = re.compile(r'[a-z]{4,}')
+
+
+@lru_cache(maxsize=4096)
+def _is_likely_math_line(text: str) -> bool:
+    """
+    Classify a line as math or not; repeated lines are answered from the cache.
+    
+    Args:
+        text: Text line to analyze
+        
+    Returns:
+        True if the line likely contains mathematical expressions
+    """
+    # Plain prose without any operator or bracket cannot be math
+    if not _MATH_LINE_HINT_RE.search(text):
+        return False
+    
+    # Be VERY conservative - only detect actual math, not normal text
+    text_lower = text.lower()
+    text_stripped = text.strip()
+    
+    # Exclude if it looks like normal prose
+    # If it has many common English words, it's probably not a math line
+    if len(_COMMON_WORDS.intersection(_WORD_RE.findall(text_lower))) >= 2:  # If it has 2+ common words, it's prose
+        return False
+    
+    # If the line is very long (>80 chars) and looks like a sentence, it's not math
+    if len(text_stripped) > 80 and _SENTENCE_RE.search(text_lower):
+        return False
+    
+    # Exclude obvious non-mathematical contexts
+    if _NON_MATH_CONTEXT_RE.search(text_lower):
+        return False
+    
+    # Strong indicators suggest it's definitely math
+    if _STRONG_MATH_RE.search(text):
+        return True
+    
+    # Check for explicit math: equations with = and mathematical operators
+    # But only if it looks like an actual equation, not a comparison in text
+    if _EQUATION_RE.search(text):
+        # Make sure it's not just text with = in it
+        if not _EQUALITY_WORDS_RE.search(text_lower):
+            return True
+    
+    # Very short lines with just symbols might be math
+    if len(text_stripped) < 20 and _MATH_SYMBOL_RE.search(text) and not _LONG_WORD_RE.search(text_lower):
+        return True
+    
+    return False
+
+
+# Processor owned by each worker process of convert_many_parallel
+_worker_processor = None
+
+
+def _init_worker(processor_class: type) -> None:
+    """
+    Create the math processor a worker process converts its chunks with.
+    
+    Args:
+        processor_class: MathProcessor class (or subclass) to instantiate
+    """
+    global _worker_processor
+    _worker_processor = processor_class()
+
+
+def _convert_chunk(lines: List[str]) -> List[str]:
+    """
+    Convert one chunk of lines in a worker process.
+    
+    Args:
+        lines: Input lines with mathematical expressions
+        
+    Returns:
+        Converted lines, in the same order
+    """
+    return _worker_processor.convert_many(lines)
+
+
+def _reconstruct_drain_current(match: re.Match) -> str:
+    """
+    Rebuild the MOSFET drain current equation from its flattened PDF text.
+    
+    Args:
+        match: Match of the equation_reconstruction pattern
+        
+    Returns:
+        LaTeX for the equation
+    """
+    current, _, width, length, gate, threshold, power = match.groups()
+    return (f'{current.replace("ID", "I_D")} = \\frac{{1}}{{2}}\\mu_n C_{{ox}} '
+            f'\\frac{{{width}}}{{{length}}}({gate.replace("VGS", "V_{GS}")} - '
+            f'{threshold.replace("Vth", "V_{th}")})^{{{power}}}')
+
+
 class MathProcessor:
     """
     Processes mathematical expressions and converts them to LaTeX format.
@@ -18,9 +184,40 @@ class MathProcessor:
         self.patterns = self._initialize_patterns()
         self.greek_letters = self._initialize_greek_letters()
         
+        # Single-character operators and Greek letters are each replaced in one pass
+        operators = self.patterns['operators']
+        self._operator_latex = {
+            pattern: compiled.sub(replacement, pattern)
+            for pattern, compiled, replacement in zip(
+                operators['patterns'], operators['compiled'], operators['replacements']
+            )
+        }
+        self._operator_re = re.compile('[' + ''.join(map(re.escape, self._operator_latex)) + ']')
+        self._greek_re = re.compile('[' + ''.join(map(re.escape, self.greek_letters)) + ']')
+        self._conversion_steps = self._build_conversion_steps()
+        
+        # Short lines repeat a lot in real documents (headers, labels, small equations).
+        # The cache is per instance because conversion depends on this instance's pattern
+        # tables, which a subclass may change. Caching the bound method makes a reference
+        # cycle; the garbage collector frees it along with the processor, which lives as
+        # long as its generator anyway.
+        self._convert_short = lru_cache(maxsize=4096)(self._convert)
+        
     def _initialize_patterns(self) -> Dict[str, Dict]:
         """Initialize mathematical pattern definitions."""
-        return {
+        # Negated classes also exclude _LINE_SEPARATOR, so no match spans two lines in convert_many
+        patterns = {
+            # Specific equation patterns. These run first: they match the raw ")2" that
+            # the superscript rule below would otherwise rewrite to ")^{2}".
+            'equation_reconstruction': {
+                'patterns': [
+                    r'([A-Z]+)\s*=\s*1\s*2([µμ][a-z]+[A-Z][a-z]*)\s*([A-Z])\s*([A-Z])\s*\(([A-Z]+)\s*[\-]\s*([A-Z][a-z]+)\)([0-9])',  # ID = 1 2µnCox W L (VGS -Vth)2
+                ],
+                'replacements': [
+                    _reconstruct_drain_current
+                ]
+            },
+            
             # Superscripts and subscripts
             'superscript': {
                 'patterns': [
@@ -48,14 +245,16 @@ class MathProcessor:
                 'replacements': [
                     r'\1_{\2}',
                     lambda m: f'{m.group(1)}_{{{self._convert_unicode_subscript(m.group(2))}}}',
-                ]
+                ],
+                # Matches never overlap or feed each other, so both patterns run as one pass
+                'independent': True
             },
             
             # Fractions
             'fractions': {
                 'patterns': [
                     r'(\d+)/(\d+)',  # Simple fractions: 1/2, 3/4
-                    r'\(([^)]+)\)/\(([^)]+)\)',  # Parenthesized fractions: (x+1)/(x-1)
+                    r'\(([^)\uffff]+)\)/\(([^)\uffff]+)\)',  # Parenthesized fractions: (x+1)/(x-1)
                     r'\b([A-Z])/([A-Z])\b',  # Variable fractions: W/L → \frac{W}{L}
                 ],
                 'replacements': [
@@ -68,7 +267,7 @@ class MathProcessor:
             # Square roots
             'square_roots': {
                 'patterns': [
-                    r'√\(([^)]+)\)',  # √(expression)
+                    r'√\(([^)\uffff]+)\)',  # √(expression)
                     r'√([a-zA-Z0-9]+)',  # √x, √25
                 ],
                 'replacements': [
@@ -114,12 +313,12 @@ class MathProcessor:
                     r'E\s*=\s*mc\^2',
                     r'a²\s*\+\s*b²\s*=\s*c²',  # Pythagorean theorem
                     r'a\^2\s*\+\s*b\^2\s*=\s*c\^2',
-                    r'sin\(([^)]+)\)',  # Trigonometric functions
-                    r'cos\(([^)]+)\)',
-                    r'tan\(([^)]+)\)',
-                    r'log\(([^)]+)\)',  # Logarithms
-                    r'ln\(([^)]+)\)',
-                    r'exp\(([^)]+)\)',  # Exponential
+                    r'sin\(([^)\uffff]+)\)',  # Trigonometric functions
+                    r'cos\(([^)\uffff]+)\)',
+                    r'tan\(([^)\uffff]+)\)',
+                    r'log\(([^)\uffff]+)\)',  # Logarithms
+                    r'ln\(([^)\uffff]+)\)',
+                    r'exp\(([^)\uffff]+)\)',  # Exponential
                 ],
                 'replacements': [
                     r'E = mc^{2}',
@@ -133,57 +332,45 @@ class MathProcessor:
                     r'\\ln(\1)',
                     r'\\exp(\1)'
                 ]
-            },
-            
-            # Specific equation patterns  
-            'equation_reconstruction': {
-                'patterns': [
-                    r'([A-Z]+)\s*=\s*1\s*2([µμ][a-z]+[A-Z][a-z]*)\s*([A-Z])\s*([A-Z])\s*\(([A-Z]+)\s*[\-]\s*([A-Z][a-z]+)\)([0-9])',  # ID = 1 2µnCox W L (VGS -Vth)2
-                ],
-                'replacements': [
-                    lambda m: f'{m.group(1).replace("ID", "I_D")} = \\frac{{1}}{{2}}\\mu_n C_{{ox}} \\frac{{{m.group(3)}}}{{{m.group(4)}}}({m.group(5).replace("VGS", "V_{GS}")} - {m.group(6).replace("Vth", "V_{th}")})'+'\\^{' + m.group(7) + '}'
-                ]
             }
         }
+        
+        # Compile every pattern once, alongside the raw strings
+        for pattern_data in patterns.values():
+            pattern_data['compiled'] = [re.compile(pattern) for pattern in pattern_data['patterns']]
+            
+            # Independent categories also get one alternation with a named group per pattern
+            if pattern_data.get('independent'):
+                pattern_data['union'] = re.compile('|'.join(
+                    f'(?P<p{i}>{pattern})' for i, pattern in enumerate(pattern_data['patterns'])
+                ))
+        
+        return patterns
     
     def _initialize_greek_letters(self) -> Dict[str, str]:
         """Initialize Greek letter mappings."""
         return {
-            'α': r'\\alpha', 'β': r'\\beta', 'γ': r'\\gamma', 'δ': r'\\delta',
-            'ε': r'\\epsilon', 'ζ': r'\\zeta', 'η': r'\\eta', 'θ': r'\\theta',
-            'ι': r'\\iota', 'κ': r'\\kappa', 'λ': r'\\lambda', 'μ': r'\\mu', 'µ': r'\\mu',
-            'ν': r'\\nu', 'ξ': r'\\xi', 'ο': r'\\omicron', 'π': r'\\pi',
-            'ρ': r'\\rho', 'σ': r'\\sigma', 'τ': r'\\tau', 'υ': r'\\upsilon',
-            'φ': r'\\phi', 'χ': r'\\chi', 'ψ': r'\\psi', 'ω': r'\\omega',
-            'Α': r'\\Alpha', 'Β': r'\\Beta', 'Γ': r'\\Gamma', 'Δ': r'\\Delta',
-            'Ε': r'\\Epsilon', 'Ζ': r'\\Zeta', 'Η': r'\\Eta', 'Θ': r'\\Theta',
-            'Ι': r'\\Iota', 'Κ': r'\\Kappa', 'Λ': r'\\Lambda', 'Μ': r'\\Mu',
-            'Ν': r'\\Nu', 'Ξ': r'\\Xi', 'Ο': r'\\Omicron', 'Π': r'\\Pi',
-            'Ρ': r'\\Rho', 'Σ': r'\\Sigma', 'Τ': r'\\Tau', 'Υ': r'\\Upsilon',
-            'Φ': r'\\Phi', 'Χ': r'\\Chi', 'Ψ': r'\\Psi', 'Ω': r'\\Omega'
+            'α': r'\alpha', 'β': r'\beta', 'γ': r'\gamma', 'δ': r'\delta',
+            'ε': r'\epsilon', 'ζ': r'\zeta', 'η': r'\eta', 'θ': r'\theta',
+            'ι': r'\iota', 'κ': r'\kappa', 'λ': r'\lambda', 'μ': r'\mu', 'µ': r'\mu',
+            'ν': r'\nu', 'ξ': r'\xi', 'ο': r'\omicron', 'π': r'\pi',
+            'ρ': r'\rho', 'σ': r'\sigma', 'τ': r'\tau', 'υ': r'\upsilon',
+            'φ': r'\phi', 'χ': r'\chi', 'ψ': r'\psi', 'ω': r'\omega',
+            'Α': r'\Alpha', 'Β': r'\Beta', 'Γ': r'\Gamma', 'Δ': r'\Delta',
+            'Ε': r'\Epsilon', 'Ζ': r'\Zeta', 'Η': r'\Eta', 'Θ': r'\Theta',
+            'Ι': r'\Iota', 'Κ': r'\Kappa', 'Λ': r'\Lambda', 'Μ': r'\Mu',
+            'Ν': r'\Nu', 'Ξ': r'\Xi', 'Ο': r'\Omicron', 'Π': r'\Pi',
+            'Ρ': r'\Rho', 'Σ': r'\Sigma', 'Τ': r'\Tau', 'Υ': r'\Upsilon',
+            'Φ': r'\Phi', 'Χ': r'\Chi', 'Ψ': r'\Psi', 'Ω': r'\Omega'
         }
     
     def _convert_unicode_superscript(self, text: str) -> str:
         """Convert Unicode superscript characters to normal characters."""
-        superscript_map = {
-            '⁰': '0', '¹': '1', '²': '2', '³': '3', '⁴': '4', '⁵': '5',
-            '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9', '⁺': '+', '⁻': '-'
-        }
-        result = text
-        for sup, normal in superscript_map.items():
-            result = result.replace(sup, normal)
-        return result
+        return text.translate(_SUPERSCRIPT_TABLE)
     
     def _convert_unicode_subscript(self, text: str) -> str:
         """Convert Unicode subscript characters to normal characters."""
-        subscript_map = {
-            '₀': '0', '₁': '1', '₂': '2', '₃': '3', '₄': '4', '₅': '5',
-            '₆': '6', '₇': '7', '₈': '8', '₉': '9', '₊': '+', '₋': '-'
-        }
-        result = text
-        for sub, normal in subscript_map.items():
-            result = result.replace(sub, normal)
-        return result
+        return text.translate(_SUBSCRIPT_TABLE)
     
     def detect_math_expressions(self, text: str) -> List[Dict]:
         """
@@ -195,37 +382,41 @@ class MathProcessor:
         Returns:
             List of detected math expressions with positions and types
         """
+        # Most lines contain nothing any pattern could match
+        if not _MATH_TRIGGER_RE.search(text):
+            return []
+        
         math_expressions = []
         
         # Check for various mathematical patterns
         for category, pattern_data in self.patterns.items():
-            patterns = pattern_data['patterns']
-            for i, pattern in enumerate(patterns):
-                matches = re.finditer(pattern, text)
-                for match in matches:
+            for i, compiled in enumerate(pattern_data['compiled']):
+                for match in compiled.finditer(text):
+                    start, end = match.span()
                     math_expressions.append({
                         'type': category,
-                        'original': match.group(0),
-                        'start': match.start(),
-                        'end': match.end(),
+                        'original': text[start:end],
+                        'start': start,
+                        'end': end,
                         'pattern_index': i,
                         'groups': match.groups()
                     })
         
-        # Check for Greek letters
-        for greek, latex in self.greek_letters.items():
-            if greek in text:
-                for match in re.finditer(re.escape(greek), text):
-                    math_expressions.append({
-                        'type': 'greek_letter',
-                        'original': greek,
-                        'latex': latex,
-                        'start': match.start(),
-                        'end': match.end()
-                    })
+        # Check for Greek letters in a single pass over the text
+        greek_letters = self.greek_letters
+        for match in self._greek_re.finditer(text):
+            start = match.start()
+            greek = text[start]
+            math_expressions.append({
+                'type': 'greek_letter',
+                'original': greek,
+                'latex': greek_letters[greek],
+                'start': start,
+                'end': start + 1
+            })
         
         # Sort by position in text
-        math_expressions.sort(key=lambda x: x['start'])
+        math_expressions.sort(key=itemgetter('start'))
         
         logger.debug(f"Detected {len(math_expressions)} mathematical expressions")
         return math_expressions
@@ -240,26 +431,122 @@ class MathProcessor:
         Returns:
             Text with mathematical expressions converted to LaTeX
         """
-        result = text
+        # Most lines contain nothing any pattern could match
+        if not _MATH_TRIGGER_RE.search(text):
+            return text
         
-        # Apply pattern-based conversions
-        for category, pattern_data in self.patterns.items():
-            patterns = pattern_data['patterns']
-            replacements = pattern_data['replacements']
+        if len(text) < _CONVERT_CACHE_MAX_LENGTH:
+            return self._convert_short(text)
+        return self._convert(text)
+    
+    def convert_many(self, lines: List[str]) -> List[str]:
+        """
+        Convert a batch of lines to LaTeX with one pass of each pattern over the whole batch.
+        
+        Args:
+            lines: Input lines with mathematical expressions
             
-            for pattern, replacement in zip(patterns, replacements):
-                if callable(replacement):
-                    # Handle function-based replacements
-                    result = re.sub(pattern, replacement, result)
-                else:
-                    result = re.sub(pattern, replacement, result)
+        Returns:
+            Converted lines, in the same order
+        """
+        text = _LINE_SEPARATOR.join(lines)
+        
+        # Lines that already contain the separator cannot be split back apart
+        if text.count(_LINE_SEPARATOR) != max(len(lines) - 1, 0):
+            return [self.convert_to_latex(line) for line in lines]
+        
+        if not _MATH_TRIGGER_RE.search(text):
+            return list(lines)
+        
+        return self._convert(text).split(_LINE_SEPARATOR)
+    
+    def convert_many_parallel(self, lines: List[str], max_workers: Optional[int] = None,
+                              chunk_size: int = _PARALLEL_CHUNK_SIZE) -> List[str]:
+        """
+        Convert a large batch of lines, spreading chunks of it over worker processes.
+        
+        Args:
+            lines: Input lines with mathematical expressions
+            max_workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Number of lines sent to a worker at a time
+            
+        Returns:
+            Converted lines, in the same order
+        """
+        # Starting processes only pays off when there is more than one chunk
+        if len(lines) <= chunk_size or max_workers == 1:
+            return self.convert_many(lines)
+        
+        chunks = [lines[start:start + chunk_size] for start in range(0, len(lines), chunk_size)]
         
-        # Convert Greek letters
-        for greek, latex in self.greek_letters.items():
-            result = result.replace(greek, latex)
+        # Pattern tables hold lambdas and cannot be pickled, so each worker builds its own processor
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(type(self),)) as executor:
+            converted = []
+            for chunk in executor.map(_convert_chunk, chunks):
+                converted.extend(chunk)
         
+        return converted
+    
+    def _convert(self, text: str) -> str:
+        """
+        Apply every conversion pattern and the Greek letter table to a line.
+        
+        Args:
+            text: Input text with mathematical expressions
+            
+        Returns:
+            Text with mathematical expressions converted to LaTeX
+        """
+        result = text
+        for compiled, replacement in self._conversion_steps:
+            result = compiled.sub(replacement, result)
         return result
     
+    def _build_conversion_steps(self) -> List[Tuple[re.Pattern, Any]]:
+        """
+        Flatten the pattern categories into the ordered substitutions convert_to_latex runs.
+        
+        Returns:
+            List of (compiled pattern, replacement string or function) pairs
+        """
+        steps = []
+        
+        for category, pattern_data in self.patterns.items():
+            if category == 'operators':
+                operator_latex = self._operator_latex
+                steps.append((self._operator_re, lambda m: operator_latex[m.group()]))
+            elif 'union' in pattern_data:
+                steps.append((pattern_data['union'], partial(self._replace_union_match, pattern_data=pattern_data)))
+            else:
+                steps.extend(zip(pattern_data['compiled'], pattern_data['replacements']))
+        
+        # Greek letters go last
+        greek_letters = self.greek_letters
+        steps.append((self._greek_re, lambda m: greek_letters[m.group()]))
+        
+        return steps
+    
+    def _replace_union_match(self, match: re.Match, pattern_data: Dict) -> str:
+        """
+        Replace one match of a category's union regex using the pattern that matched.
+        
+        Args:
+            match: Match of the category's union regex
+            pattern_data: Pattern category definition
+            
+        Returns:
+            Replacement text for the match
+        """
+        index = int(match.lastgroup[1:])
+        
+        # Re-match with the original pattern so group numbers line up with the replacement
+        original = pattern_data['compiled'][index].match(match.string, match.start())
+        replacement = pattern_data['replacements'][index]
+        if callable(replacement):
+            return replacement(original)
+        return original.expand(replacement)
+    
     def is_likely_math_line(self, text: str) -> bool:
         """
         Determine if a line of text likely contains mathematical content.
@@ -270,62 +557,7 @@ class MathProcessor:
         Returns:
             True if the line likely contains mathematical expressions
         """
-        # Be VERY conservative - only detect actual math, not normal text
-        text_lower = text.lower()
-        text_stripped = text.strip()
-        
-        # Exclude if it looks like normal prose
-        # If it has many common English words, it's probably not a math line
-        common_words = ['the', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'with', 'is', 'are', 'was', 'were',
-                       'find', 'determine', 'calculate', 'draw', 'assume', 'given', 'take', 'consider',
-                       'exam', 'comprehensive', 'semester', 'first', 'second', 'open', 'book', 'marks']
-        word_count = 0
-        for word in common_words:
-            if re.search(rf'\b{word}\b', text_lower):
-                word_count += 1
-                if word_count >= 2:  # If it has 2+ common words, it's prose
-                    return False
-        
-        # If the line is very long (>80 chars) and looks like a sentence, it's not math
-        if len(text_stripped) > 80 and re.search(r'[a-z]+\s+[a-z]+\s+[a-z]+', text_lower):
-            return False
-        
-        # Exclude obvious non-mathematical contexts
-        if re.search(r'(?:section|chapter|version|figure|table|page|marks|semester|exam)\s', text_lower):
-            return False
-        
-        # Now check for STRONG mathematical indicators only
-        strong_math_indicators = [
-            r'[∑∏∫∂∇]',        # Strong mathematical symbols (removed ∆ as it appears in text)
-            r'√\([^)]+\)',       # Square root with parentheses
-            r'\b(sin|cos|tan|log|ln|exp|sinc)\s*\(',  # Mathematical functions with parentheses
-            r'\\(frac|sqrt|int|sum|prod)',  # LaTeX math commands
-            r'[a-z]\s*=\s*[0-9]+\s*[+\-\*/]',  # Simple equations like x = 2 + 3
-            r'[a-zA-Z]\(t\)\s*=',  # Functions of time like m(t) =
-            r'^\s*\([a-z]\)\s',  # Question numbers like "(a)" at start
-            r'\d+\s*[×÷±∓]\s*\d+',  # Arithmetic with special operators
-            r'[≤≥≠≈∞]',  # Mathematical comparison operators
-            r'\^\s*\{[^}]+\}',  # Explicit superscript in LaTeX format
-            r'_\s*\{[^}]+\}',  # Explicit subscript in LaTeX format
-        ]
-        
-        # Strong indicators suggest it's definitely math
-        for indicator in strong_math_indicators:
-            if re.search(indicator, text):
-                return True
-        
-        # Check for explicit math: equations with = and mathematical operators
-        # But only if it looks like an actual equation, not a comparison in text
-        if re.search(r'\b[a-zA-Z][a-zA-Z0-9]*\s*=\s*[^,]+[+\-\*/\^]', text):
-            # Make sure it's not just text with = in it
-            if not re.search(r'\b(equal|equals|set)\b', text_lower):
-                return True
-        
-        # Very short lines with just symbols might be math
-        if len(text_stripped) < 20 and re.search(r'[=+\-\*/\^]', text) and not re.search(r'[a-z]{4,}', text_lower):
-            return True
-        
-        return False
+        return _is_likely_math_line(text)
     
     def wrap_math_expressions(self, text: str, inline_threshold: int = 50) -> str:
         """
@@ -341,9 +573,9 @@ class MathProcessor:
         # Simple heuristic: if line is short and contains math, make it inline
         # If line is mostly math or long math expression, make it display
         
-        if self.is_likely_math_line(text.strip()):
-            clean_text = text.strip()
-            
+        clean_text = text.strip()
+        
+        if self.is_likely_math_line(clean_text):
             # Check if it's a standalone equation
             if len(clean_text) < inline_threshold and not clean_text.endswith('.'):
                 # Likely a standalone equation - use display math
@@ -353,3 +585,4 @@ class MathProcessor:
                 return f"${clean_text}$"
         
         return text
+
@@ -9,6 +9,121 @@ from loguru import logger
 from datetime import datetime
 
 
+# "Page N" header/footer lines; bare page numbers are checked with str methods
+_PAGE_NUMBER_RE = re.compile(r'page\s+\d+')
+
+# Lowercase Roman numerals used as front-matter page numbers
+_ROMAN_NUMERAL_CHARS = 'ivxlc'
+
+# Title line scoring: a proper case line, otherwise the first year or email.
+# Proper case lines hold no digits or '@', so one search answers both checks.
+_TITLE_CONTENT_RE = re.compile(r'(?P<proper>^[A-Z][A-Za-z\s\-:]+$)|\d{4}|\w+@\w+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Score given to a title found by font size analysis
+_FONT_TITLE_SCORE = 10
+
+# Lines at these leading positions get the largest position bonus in title scoring;
+# without it a line scores at most _FONT_TITLE_SCORE
+_TOP_TITLE_LINES = 3
+
+# Score given to a title found by the generic title patterns
+_PATTERN_TITLE_SCORE = 5
+
+# Author lines: "By Name", "Dr. Name" and plain "First Last"
+_BY_LINE_RE = re.compile(r'(?i)^by\s+(.+)$')
+_TITLED_NAME_LINE_RE = re.compile(
+    r'^(?:Dr\.?|Prof\.?|Professor)\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+\s*$', re.IGNORECASE
+)
+_NAME_LINE_RE = re.compile(r'^[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+){1,3}\s*$')
+
+# Characters that never appear in an author name
+_INVALID_NAME_CHARS_RE = re.compile(r'[0-9@#$%^&*(){}[\]|\\<>+=]')
+
+# Words that mark a candidate as an affiliation or heading rather than a name
+_NON_NAME_WORDS = ('university', 'institute', 'department', 'college', 'abstract', 'introduction')
+
+# Four-digit year inside a date string
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Patterns for detecting titles in document content
+_TITLE_PATTERNS = (
+    # Common title formatting patterns (newline terminated)
+    r'^([A-Z][^.\n]{10,80})(?:\n|$)',
+    # Centered text patterns
+    r'^\s*([A-Z][A-Za-z\s\-:]{10,80})\s*$',
+    # Title-like text at start (more restrictive - stops at common separators)
+    r'^([A-Z][A-Za-z\s\-:]{5,50})(?=\s+[A-Z][a-z]+\s+[A-Z][a-z]+|\s+\d{1,2}[/-]\d|\s+(?:January|February|March|April|May|June|July|August|September|October|November|December))',
+    # Bold or emphasized text (detected by font analysis)
+    r'([A-Z][A-Za-z\s\-:]{10,80})',
+)
+
+# Patterns for detecting authors
+_AUTHOR_PATTERNS = (
+    # "By Author Name" patterns - more flexible
+    r'(?i)(?:by|written by)[:,]?\s*([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+)',
+    # "Author:" patterns
+    r'(?i)author[:,]\s*([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+(?:\s+and\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+)*)',
+    # Dr./Prof. patterns at start of line
+    r'(?i)^\s*((?:Dr\.?|Prof\.?|Professor)\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)*)',
+    # Multiple authors with "and"
+    r'\b([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+(?:\s+and\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+)+)',
+    # Email pattern (often indicates author)
+    r'([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+).*?@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+    # Institution affiliation pattern  
+    r'([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+).*?(?:University|Institute|College|Department)',
+)
+
+# Patterns for detecting dates
+_DATE_PATTERNS = (
+    # Full date formats
+    r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
+    r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
+    r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})',
+    r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+    # Month and year only
+    r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+    # Year only
+    r'(?:©|\(c\)|copyright)?\s*(\d{4})',
+    r'(?:published|created|updated)[:]\s*(\d{4})',
+)
+
+# Common academic/document keywords that help identify content structure
+_STRUCTURE_KEYWORDS = {
+    'abstract': r'(?i)\babstract\b',
+    'introduction': r'(?i)\b(?:introduction|overview)\b',
+    'conclusion': r'(?i)\b(?:conclusion|summary|final)\b',
+    'references': r'(?i)\b(?:references|bibliography|works cited)\b',
+}
+
+# Characters each date pattern can start with (None where re already scans quickly);
+# the lookahead lets re skip to candidate positions instead of trying every month name
+_DATE_PATTERN_STARTS = (None, None, '[adfjmnos]', None, '[adfjmnos]', r'[©(c\s\d]', '[cpu]')
+
+# Compiled once per process, with the flags each detector searches with
+_TITLE_REGEXES = tuple(re.compile(pattern, re.MULTILINE | re.IGNORECASE) for pattern in _TITLE_PATTERNS)
+_AUTHOR_REGEXES = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in _AUTHOR_PATTERNS)
+_DATE_REGEXES = tuple(
+    re.compile(pattern if start is None else f'(?={start}){pattern}', re.IGNORECASE)
+    for pattern, start in zip(_DATE_PATTERNS, _DATE_PATTERN_STARTS)
+)
+_STRUCTURE_REGEXES = {section: re.compile(pattern) for section, pattern in _STRUCTURE_KEYWORDS.items()}
+
+# Title and author heuristics only look at the first lines of a page
+_HEAD_LINE_COUNT = 10
+
+# Literal words behind each structure keyword pattern, used to find where a match can start
+_STRUCTURE_LITERALS = {
+    'abstract': ('abstract',),
+    'introduction': ('introduction', 'overview'),
+    'conclusion': ('conclusion', 'summary', 'final'),
+    'references': ('references', 'bibliography', 'works cited'),
+}
+
+# Characters that still case-fold onto keyword letters after lower()
+_FOLDING_CHARS = ('\u0131', '\u017f')
+
+
 class MetadataExtractor:
     """
     Enhanced metadata extractor for PDF documents.
@@ -17,57 +132,37 @@ class MetadataExtractor:
     def __init__(self):
         """Initialize the metadata extractor."""
         # Patterns for detecting titles in document content
-        self.title_patterns = [
-            # Common title formatting patterns (newline terminated)
-            r'^([A-Z][^.\n]{10,80})(?:\n|$)',
-            # Centered text patterns
-            r'^\s*([A-Z][A-Za-z\s\-:]{10,80})\s*$',
-            # Title-like text at start (more restrictive - stops at common separators)
-            r'^([A-Z][A-Za-z\s\-:]{5,50})(?=\s+[A-Z][a-z]+\s+[A-Z][a-z]+|\s+\d{1,2}[/-]\d|\s+(?:January|February|March|April|May|June|July|August|September|October|November|December))',
-            # Bold or emphasized text (detected by font analysis)
-            r'([A-Z][A-Za-z\s\-:]{10,80})',
-        ]
+        self.title_patterns = list(_TITLE_PATTERNS)
         
         # Patterns for detecting authors
-        self.author_patterns = [
-            # "By Author Name" patterns - more flexible
-            r'(?i)(?:by|written by)[:,]?\s*([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+)',
-            # "Author:" patterns
-            r'(?i)author[:,]\s*([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+(?:\s+and\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+)*)',
-            # Dr./Prof. patterns at start of line
-            r'(?i)^\s*((?:Dr\.?|Prof\.?|Professor)\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)*)',
-            # Multiple authors with "and"
-            r'\b([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+(?:\s+and\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+)+)',
-            # Email pattern (often indicates author)
-            r'([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+).*?@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            # Institution affiliation pattern  
-            r'([A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+).*?(?:University|Institute|College|Department)',
-        ]
+        self.author_patterns = list(_AUTHOR_PATTERNS)
         
         # Patterns for detecting dates
-        self.date_patterns = [
-            # Full date formats
-            r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-            r'(\d{4}[/-]\d{1,2}[/-]\d{1,2})',
-            r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})',
-            r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-            # Month and year only
-            r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-            # Year only
-            r'(?:©|\(c\)|copyright)?\s*(\d{4})',
-            r'(?:published|created|updated)[:]\s*(\d{4})',
-        ]
+        self.date_patterns = list(_DATE_PATTERNS)
         
         # Common academic/document keywords that help identify content structure
-        self.structure_keywords = {
-            'abstract': r'(?i)\babstract\b',
-            'introduction': r'(?i)\b(?:introduction|overview)\b',
-            'conclusion': r'(?i)\b(?:conclusion|summary|final)\b',
-            'references': r'(?i)\b(?:references|bibliography|works cited)\b',
-        }
+        self.structure_keywords = dict(_STRUCTURE_KEYWORDS)
         
         logger.info("Initialized MetadataExtractor")
     
+    def _title_regexes(self) -> Tuple[re.Pattern, ...]:
+        """Compiled title patterns; the defaults are shared, customised lists are compiled on use."""
+        if self.title_patterns == list(_TITLE_PATTERNS):
+            return _TITLE_REGEXES
+        return tuple(re.compile(pattern, re.MULTILINE | re.IGNORECASE) for pattern in self.title_patterns)
+    
+    def _author_regexes(self) -> Tuple[re.Pattern, ...]:
+        """Compiled author patterns; the defaults are shared, customised lists are compiled on use."""
+        if self.author_patterns == list(_AUTHOR_PATTERNS):
+            return _AUTHOR_REGEXES
+        return tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in self.author_patterns)
+    
+    def _date_regexes(self) -> Tuple[re.Pattern, ...]:
+        """Compiled date patterns; only the shared defaults carry start-character lookaheads."""
+        if self.date_patterns == list(_DATE_PATTERNS):
+            return _DATE_REGEXES
+        return tuple(re.compile(pattern, re.IGNORECASE) for pattern in self.date_patterns)
+    
     def extract_enhanced_metadata(self, document: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract enhanced metadata from a parsed document.
@@ -86,17 +181,18 @@ class MetadataExtractor:
         # Get document text for content analysis
         full_text = self._get_document_text(document)
         first_page_text = self._get_first_page_text(document)
+        first_page_lines = self._split_head_lines(first_page_text)
         
         # Extract title if not present or improve existing
         if not metadata.get('title') or len(metadata.get('title', '').strip()) < 3:
-            detected_title = self._detect_title(first_page_text, full_text, document)
+            detected_title = self._detect_title(first_page_text, full_text, document, first_page_lines)
             if detected_title:
                 metadata['title'] = detected_title
                 logger.info(f"Detected title: {detected_title}")
         
         # Extract author if not present
         if not metadata.get('author'):
-            detected_author = self._detect_author(first_page_text, full_text)
+            detected_author = self._detect_author(first_page_text, full_text, first_page_lines)
             if detected_author:
                 metadata['author'] = detected_author
                 logger.info(f"Detected author: {detected_author}")
@@ -134,7 +230,20 @@ class MetadataExtractor:
             return pages[0].get('text', '')
         return ''
     
-    def _detect_title(self, first_page_text: str, full_text: str, document: Dict[str, Any]) -> Optional[str]:
+    def _split_head_lines(self, text: str) -> List[str]:
+        """
+        Split only as much of the text as the line heuristics look at.
+        
+        Args:
+            text: Text to split
+            
+        Returns:
+            The first lines of the text, with the unsplit remainder as the last item
+        """
+        return text.split('\n', _HEAD_LINE_COUNT)
+    
+    def _detect_title(self, first_page_text: str, full_text: str, document: Dict[str, Any],
+                      first_page_lines: Optional[List[str]] = None) -> Optional[str]:
         """
         Detect document title using various heuristics.
         
@@ -142,6 +251,7 @@ class MetadataExtractor:
             first_page_text: Text from the first page
             full_text: Full document text
             document: Complete document structure
+            first_page_lines: First page already split by _split_head_lines
             
         Returns:
             Detected title or None
@@ -151,10 +261,14 @@ class MetadataExtractor:
         # Method 1: Look for largest text on first page using font information
         title_from_fonts = self._detect_title_from_fonts(document)
         if title_from_fonts:
-            candidates.append((title_from_fonts, 10))  # High confidence
+            candidates.append((title_from_fonts, _FONT_TITLE_SCORE))  # High confidence
         
-        # Method 2: Look for text patterns typical of titles
-        lines = first_page_text.split('\n')[:10]  # Check first 10 lines
+        # Method 2: Look for text patterns typical of titles. Ties keep the font title,
+        # so with one only the top lines can still score high enough to win.
+        if first_page_lines is None:
+            first_page_lines = self._split_head_lines(first_page_text)
+        line_count = _TOP_TITLE_LINES if title_from_fonts else _HEAD_LINE_COUNT
+        lines = first_page_lines[:line_count]
         
         for i, line in enumerate(lines):
             line = line.strip()
@@ -162,7 +276,7 @@ class MetadataExtractor:
                 continue
             
             # Skip lines that look like headers/footers
-            if re.search(r'page\s+\d+|^\d+$|^[ivxlc]+$', line.lower()):
+            if self._looks_like_header_footer(line.lower()):
                 continue
             
             # Look for title-like characteristics
@@ -175,31 +289,33 @@ class MetadataExtractor:
                 score -= 2
             
             # Position-based scoring (earlier is better)
-            if i <= 2:
+            if i < _TOP_TITLE_LINES:
                 score += 3
             elif i <= 5:
                 score += 1
             
             # Content-based scoring
-            if re.match(r'^[A-Z][A-Za-z\s\-:]+$', line):  # Proper case
+            content_match = _TITLE_CONTENT_RE.search(line)
+            is_proper_case = content_match is not None and content_match.lastgroup == 'proper'
+            if is_proper_case:  # Proper case
                 score += 2
             if ':' in line and line.count(':') == 1:  # Subtitle pattern
                 score += 2
             if line.isupper() and len(line) > 15:  # All caps (common for titles)
                 score += 1
-            if not re.search(r'\d{4}|\w+@\w+', line):  # No years or emails
+            if content_match is None or is_proper_case:  # No years or emails
                 score += 1
             
             if score >= 4:
                 candidates.append((line, score))
         
-        # Method 3: Look for common title patterns
-        for pattern in self.title_patterns:
-            matches = re.finditer(pattern, first_page_text, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
-                candidate = match.group(1).strip()
-                if 10 <= len(candidate) <= 100:
-                    candidates.append((candidate, 5))
+        # Method 3: Look for common title patterns. Pattern matches all score the
+        # same and rank after earlier candidates with that score, so only the first
+        # one can win, and only when nothing scored at least as high already.
+        if max((score for _, score in candidates), default=0) < _PATTERN_TITLE_SCORE:
+            pattern_title = self._find_pattern_title(first_page_text)
+            if pattern_title:
+                candidates.append((pattern_title, _PATTERN_TITLE_SCORE))
         
         # Select best candidate
         if candidates:
@@ -208,13 +324,48 @@ class MetadataExtractor:
             best_title = candidates[0][0]
             
             # Clean up the title
-            best_title = re.sub(r'\s+', ' ', best_title)  # Normalize whitespace
+            best_title = _WHITESPACE_RE.sub(' ', best_title)  # Normalize whitespace
             best_title = best_title.strip()
             
             return best_title
         
         return None
     
+    def _looks_like_header_footer(self, line_lower: str) -> bool:
+        """
+        Check if a stripped, lowercased line is a page number or "page N" header/footer.
+        
+        Args:
+            line_lower: Stripped line in lowercase
+            
+        Returns:
+            True if the line should not be considered as a title
+        """
+        # str.isdecimal accepts exactly the characters \d does
+        if line_lower.isdecimal():
+            return True
+        if line_lower and not line_lower.strip(_ROMAN_NUMERAL_CHARS):
+            return True
+        return 'page' in line_lower and _PAGE_NUMBER_RE.search(line_lower) is not None
+    
+    def _find_pattern_title(self, first_page_text: str) -> Optional[str]:
+        """
+        Find the first title pattern match of a plausible title length.
+        
+        Args:
+            first_page_text: Text from the first page
+            
+        Returns:
+            First matching title candidate or None
+        """
+        for regex in self._title_regexes():
+            for match in regex.finditer(first_page_text):
+                candidate = match.group(1).strip()
+                if 10 <= len(candidate) <= 100:
+                    return candidate
+        
+        return None
+    
     def _detect_title_from_fonts(self, document: Dict[str, Any]) -> Optional[str]:
         """
         Detect title based on font size analysis (PyMuPDF only).
@@ -234,8 +385,10 @@ class MetadataExtractor:
         if not text_dict or 'blocks' not in text_dict:
             return None
         
-        # Analyze font sizes and find largest text
-        font_analysis = []
+        # Analyze font sizes, keeping span attributes in parallel lists
+        texts = []
+        sizes = []
+        bboxes = []
         
         for block in text_dict['blocks']:
             if 'lines' not in block:
@@ -248,48 +401,42 @@ class MetadataExtractor:
                 for span in line['spans']:
                     text = span.get('text', '').strip()
                     font_size = span.get('size', 0)
-                    font_flags = span.get('flags', 0)
                     
                     if text and len(text) > 5:
-                        is_bold = bool(font_flags & 2**4)  # Bold flag
-                        font_analysis.append({
-                            'text': text,
-                            'size': font_size,
-                            'is_bold': is_bold,
-                            'bbox': span.get('bbox', [0, 0, 0, 0])
-                        })
-        
-        if not font_analysis:
-            return None
+                        texts.append(text)
+                        sizes.append(font_size)
+                        bboxes.append(span.get('bbox', [0, 0, 0, 0]))
         
-        # Find text with largest font size
-        font_analysis.sort(key=lambda x: x['size'], reverse=True)
+        if not sizes:
+            return None
         
         # Look for title candidates in top 20% of font sizes
-        max_size = font_analysis[0]['size']
+        max_size = max(sizes)
         size_threshold = max_size * 0.8
         
-        title_candidates = []
-        for item in font_analysis:
-            if item['size'] >= size_threshold:
-                text = item['text']
+        # Pick the largest suitable candidate; among equal sizes the earliest span wins
+        best_index = None
+        for index, size in enumerate(sizes):
+            if size >= size_threshold and (best_index is None or size > sizes[best_index]):
+                text = texts[index]
                 # Filter out short texts and page numbers
-                if len(text) >= 10 and not re.match(r'^\d+$', text.strip()) and item['bbox'][1] < 200:  # Top area
-                    title_candidates.append(text)
+                if len(text) >= 10 and not text.isdecimal() and bboxes[index][1] < 200:  # Top area
+                    best_index = index
         
-        if title_candidates:
-            # Return the first (largest) suitable candidate
-            return title_candidates[0]
+        if best_index is not None:
+            return texts[best_index]
         
         return None
     
-    def _detect_author(self, first_page_text: str, full_text: str) -> Optional[str]:
+    def _detect_author(self, first_page_text: str, full_text: str,
+                       first_page_lines: Optional[List[str]] = None) -> Optional[str]:
         """
         Detect document author using various patterns.
         
         Args:
             first_page_text: Text from the first page
             full_text: Full document text
+            first_page_lines: First page already split by _split_head_lines
             
         Returns:
             Detected author or None
@@ -297,25 +444,30 @@ class MetadataExtractor:
         candidates = []
         
         # Search in first page with higher priority
-        search_texts = [(first_page_text, 2), (full_text[:2000], 1)]  # Weight first page higher
-        
-        for text, weight in search_texts:
-            # Split into lines for better pattern matching
-            lines = text.split('\n')
+        if first_page_lines is None:
+            first_page_lines = self._split_head_lines(first_page_text)
+        search_texts = [(first_page_text, first_page_lines, 2)]  # Weight first page higher
+        head_text = full_text[:2000]
+        if head_text != first_page_text:
+            # An identical text would only repeat the first page's candidates at a lower weight
+            search_texts.append((head_text, self._split_head_lines(head_text), 1))
+        
+        for text, lines, weight in search_texts:
+            # Nothing found here can outrank a candidate already at the best weight this text can give
+            if candidates and max(score for _, score in candidates) >= weight + 2:
+                break
             
-            for pattern in self.author_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
+            for regex in self._author_regexes():
+                for match in regex.finditer(text):
                     author = match.group(1).strip()
                     # Basic validation for author names
                     if self._is_valid_author_name(author):
                         candidates.append((author, weight))
             
             # Look for lines that might be author names with "By" prefix
-            by_pattern = r'(?i)^by\s+(.+)$'
-            for line in lines[:10]:
+            for line in lines[:_HEAD_LINE_COUNT]:
                 line = line.strip()
-                by_match = re.match(by_pattern, line)
+                by_match = _BY_LINE_RE.match(line)
                 if by_match:
                     potential_author = by_match.group(1).strip()
                     if self._is_valid_author_name(potential_author):
@@ -332,12 +484,12 @@ class MetadataExtractor:
                     continue
                 
                 # Look for lines with title + name pattern
-                if re.match(r'^(?:Dr\.?|Prof\.?|Professor)\s+[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+)+\s*$', line, re.IGNORECASE):
+                if _TITLED_NAME_LINE_RE.match(line):
                     if self._is_valid_author_name(line):
                         candidates.append((line, weight + 1))
                 
                 # Look for simple name patterns (First Last, First Middle Last)
-                elif re.match(r'^[A-Z][a-zA-Z.]+(?:\s+[A-Z][a-zA-Z.]+){1,3}\s*$', line):
+                elif _NAME_LINE_RE.match(line):
                     if self._is_valid_author_name(line) and not self._looks_like_title(line):
                         candidates.append((line, weight))
         
@@ -365,9 +517,8 @@ class MetadataExtractor:
         search_texts = [first_page_text, full_text[:1000]]
         
         for text in search_texts:
-            for pattern in self.date_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
+            for regex in self._date_regexes():
+                for match in regex.finditer(text):
                     date_str = match.group(1).strip()
                     if self._is_valid_date(date_str):
                         candidates.append(date_str)
@@ -398,10 +549,25 @@ class MetadataExtractor:
         }
         
         text_lower = full_text.lower()
+        literal_prefilter = not any(char in text_lower for char in _FOLDING_CHARS)
         
         # Check for common document sections
         for section, pattern in self.structure_keywords.items():
-            if re.search(pattern, text_lower):
+            # Default patterns are precompiled; the literal prefilter only describes those
+            if pattern == _STRUCTURE_KEYWORDS.get(section):
+                regex = _STRUCTURE_REGEXES[section]
+                literals = _STRUCTURE_LITERALS.get(section)
+            else:
+                regex = re.compile(pattern)
+                literals = None
+            start = 0
+            if literal_prefilter and literals:
+                # Skip to the first literal hit; a section with no hit cannot match
+                hits = [index for index in map(text_lower.find, literals) if index >= 0]
+                if not hits:
+                    continue
+                start = min(hits)
+            if regex.search(text_lower, start):
                 structure[f'has_{section}'] = True
         
         # Estimate document type based on structure
@@ -422,13 +588,14 @@ class MetadataExtractor:
         
         # Should contain at least one space (first + last name) or be a title+name
         has_space = ' ' in name
-        has_title = name.lower().startswith(('dr.', 'prof.', 'professor'))
+        name_lower = name.lower()
+        has_title = name_lower.startswith(('dr.', 'prof.', 'professor'))
         
         if not has_space and not has_title:
             return False
         
         # Should not contain numbers or most special characters (except common ones like periods, hyphens)
-        if re.search(r'[0-9@#$%^&*(){}[\]|\\<>+=]', name):
+        if _INVALID_NAME_CHARS_RE.search(name):
             return False
         
         # Should not be all uppercase or all lowercase (unless it has titles)
@@ -436,9 +603,9 @@ class MetadataExtractor:
             return False
         
         # Should not contain common non-name words
-        non_name_words = ['university', 'institute', 'department', 'college', 'abstract', 'introduction']
-        if any(word in name.lower() for word in non_name_words):
-            return False
+        for word in _NON_NAME_WORDS:
+            if word in name_lower:
+                return False
         
         return True
     
@@ -461,7 +628,7 @@ class MetadataExtractor:
             return False
         
         # Check if it's a reasonable year (1900-2030)
-        year_match = re.search(r'\d{4}', date_str)
+        year_match = _YEAR_RE.search(date_str)
         if year_match:
             year = int(year_match.group())
             if not (1900 <= year <= 2030):
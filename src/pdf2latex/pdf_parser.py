@@ -5,12 +5,35 @@ PDF parsing module using multiple libraries for robust text and structure extrac
 import fitz  # PyMuPDF
 import pdfplumber
 import PyPDF2
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 import io
 from .metadata_extractor import MetadataExtractor
 
+# Pages handed to each worker process when PyMuPDF text is extracted in parallel
+_TEXT_CHUNK_PAGES = 16
+
+
+def _extract_text_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the plain text of a range of pages in a worker process.
+    
+    PyMuPDF documents cannot be shared between threads or processes, so every
+    call opens its own copy of the file.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        start: First page index (0-based)
+        stop: Page index after the last page
+        
+    Returns:
+        Text of each page in the range, in page order
+    """
+    with fitz.open(pdf_path) as doc:
+        return [doc[page_num].get_text("text", sort=True) for page_num in range(start, stop)]
+
 
 class PDFParser:
     """
@@ -22,12 +45,26 @@ class PDFParser:
         Initialize the PDF parser.
         
         Args:
-            config: Configuration options
+            config: Configuration options. 'parse_workers' sets the number of
+                processes used to extract PyMuPDF page text (default 1).
         """
         self.config = config or {}
         self.preferred_library = self.config.get('preferred_library', 'pymupdf')
+        self.lightweight = self.config.get('lightweight', False)
+        
+        # Processes used to extract PyMuPDF page text; 1 extracts pages one after another
+        self.parse_workers = self.config.get('parse_workers', 1)
         self.metadata_extractor = MetadataExtractor()
         
+        # Parsing strategies in the order parse tries them, preferred library first
+        strategies = [
+            ('pymupdf', self._parse_with_pymupdf),
+            ('pdfplumber', self._parse_with_pdfplumber),
+            ('pypdf2', self._parse_with_pypdf2)
+        ]
+        self._ordered_strategies = [(lib, func) for lib, func in strategies if lib == self.preferred_library] + \
+                                   [(lib, func) for lib, func in strategies if lib != self.preferred_library]
+        
         logger.info(f"Initialized PDFParser with preferred library: {self.preferred_library}")
     
     def parse(self, pdf_path: Path) -> Dict[str, Any]:
@@ -42,20 +79,9 @@ class PDFParser:
         """
         logger.info(f"Parsing PDF: {pdf_path}")
         
-        # Try different parsing strategies
-        strategies = [
-            ('pymupdf', self._parse_with_pymupdf),
-            ('pdfplumber', self._parse_with_pdfplumber),
-            ('pypdf2', self._parse_with_pypdf2)
-        ]
-        
-        # Start with preferred library if specified
-        if self.preferred_library:
-            strategies = [(lib, func) for lib, func in strategies if lib == self.preferred_library] + \
-                        [(lib, func) for lib, func in strategies if lib != self.preferred_library]
-        
+        # Try different parsing strategies, starting with the preferred library
         last_error = None
-        for library_name, parse_func in strategies:
+        for library_name, parse_func in self._ordered_strategies:
             try:
                 logger.info(f"Attempting to parse with {library_name}")
                 result = parse_func(pdf_path)
@@ -107,42 +133,41 @@ class PDFParser:
             'pages': []
         }
         
+        # Sorted text extraction dominates parsing time, so large documents spread it over processes
+        page_texts = self._extract_texts_in_parallel(pdf_path, len(doc))
+        
         for page_num in range(len(doc)):
             page = doc[page_num]
             
             # Extract text with better layout preservation
             # Using "blocks" mode provides better structure
-            text = page.get_text("text", sort=True)  # sort=True for better reading order
+            if page_texts is not None:
+                text = page_texts[page_num]
+            else:
+                text = page.get_text("text", sort=True)  # sort=True for better reading order
             
-            # Extract text with formatting information
-            text_dict = page.get_text("dict")
+            # Extract text with formatting information. Only the first page's is
+            # used (font-based title detection), so later pages skip the span tree.
+            text_dict = page.get_text("dict") if page_num == 0 else None
+            
+            if self.lightweight:
+                # Text only; images can be listed later with get_page_images
+                document['pages'].append({
+                    'page_number': page_num + 1,
+                    'text': text,
+                    'text_dict': text_dict
+                })
+                continue
             
             # Also extract blocks for better structure understanding
             blocks = page.get_text("blocks", sort=True)
             
-            # Extract images
-            images = []
-            image_list = page.get_images()
-            for img_index, img in enumerate(image_list):
-                xref = img[0]
-                pix = fitz.Pixmap(doc, xref)
-                if pix.n - pix.alpha < 4:  # GRAY or RGB
-                    images.append({
-                        'index': img_index,
-                        'xref': xref,
-                        'width': pix.width,
-                        'height': pix.height,
-                        'colorspace': pix.colorspace.name if pix.colorspace else 'unknown',
-                        'size': len(pix.tobytes())
-                    })
-                pix = None
-            
             page_data = {
                 'page_number': page_num + 1,
                 'text': text,
                 'text_dict': text_dict,
                 'blocks': blocks,
-                'images': images,
+                'images': self._extract_page_images(doc, page),
                 'bbox': page.rect,
                 'rotation': page.rotation
             }
@@ -152,6 +177,59 @@ class PDFParser:
         doc.close()
         return document
     
+    def _extract_texts_in_parallel(self, pdf_path: Path, page_count: int) -> Optional[List[str]]:
+        """
+        Extract the plain text of every page with a pool of worker processes.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_count: Number of pages in the document
+            
+        Returns:
+            Text of each page in page order, or None when one process is enough
+        """
+        starts = list(range(0, page_count, _TEXT_CHUNK_PAGES))
+        workers = min(self.parse_workers, len(starts))
+        if workers <= 1:
+            return None
+        
+        stops = [min(start + _TEXT_CHUNK_PAGES, page_count) for start in starts]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            page_texts = []
+            for chunk in executor.map(_extract_text_range, [str(pdf_path)] * len(starts), starts, stops):
+                page_texts.extend(chunk)
+        
+        return page_texts
+    
+    def _extract_page_images(self, doc: fitz.Document, page: fitz.Page) -> List[Dict[str, Any]]:
+        """
+        Describe the images on a PyMuPDF page.
+        
+        Args:
+            doc: Open PyMuPDF document
+            page: Page of that document
+            
+        Returns:
+            Image descriptions for GRAY and RGB images
+        """
+        images = []
+        image_list = page.get_images()
+        for img_index, img in enumerate(image_list):
+            xref = img[0]
+            pix = fitz.Pixmap(doc, xref)
+            if pix.n - pix.alpha < 4:  # GRAY or RGB
+                images.append({
+                    'index': img_index,
+                    'xref': xref,
+                    'width': pix.width,
+                    'height': pix.height,
+                    'colorspace': pix.colorspace.name if pix.colorspace else 'unknown',
+                    'size': pix.width * pix.height * pix.n  # Raw sample bytes, without encoding
+                })
+            pix = None
+        
+        return images
+    
     def _parse_with_pdfplumber(self, pdf_path: Path) -> Dict[str, Any]:
         """
         Parse PDF using pdfplumber.
@@ -254,6 +332,22 @@ class PDFParser:
         
         return '\n\n'.join(text_parts)
     
+    def get_page_images(self, pdf_path: Path, page_num: int) -> List[Dict[str, Any]]:
+        """
+        List the images on one page on demand, for documents parsed in lightweight mode.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_num: Page number (1-based)
+            
+        Returns:
+            Image descriptions for the specified page
+        """
+        with fitz.open(pdf_path) as doc:
+            if 1 <= page_num <= len(doc):
+                return self._extract_page_images(doc, doc[page_num - 1])
+        return []
+    
     def get_page_text(self, document: Dict[str, Any], page_num: int) -> str:
         """
         Get text content from a specific page.
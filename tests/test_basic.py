@@ -38,6 +38,37 @@ class TestPDF2LaTeXConverter:
         assert 'images' in features
         assert features['images'] == True  # Default preserve_images=True
 
+    def test_failed_convert_keeps_existing_output(self, tmp_path, monkeypatch):
+        """Test that output is replaced only once generation has finished."""
+        import fitz
+
+        pdf_path = tmp_path / "doc.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Some text.", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+
+        output_path = tmp_path / "doc.tex"
+        output_path.write_text("previous output")
+
+        converter = PDF2LaTeXConverter(preserve_images=False)
+
+        def failing_generate_to(self, document, output_file):
+            output_file.write("partial")
+            raise RuntimeError("generation failed")
+
+        monkeypatch.setattr(type(converter.latex_generator), 'generate_to', failing_generate_to)
+        with pytest.raises(RuntimeError):
+            converter.convert(pdf_path, output_path)
+
+        assert output_path.read_text() == "previous output"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["doc.pdf", "doc.tex"]
+
+        monkeypatch.undo()
+        converter.convert(pdf_path, output_path)
+        assert "Some text." in output_path.read_text()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["doc.pdf", "doc.tex"]
+
 
 class TestPDFParser:
     """Test cases for the PDF parser."""
@@ -51,6 +82,55 @@ class TestPDFParser:
         
         parser_custom = PDFParser(config={'preferred_library': 'pdfplumber'})
         assert parser_custom.preferred_library == 'pdfplumber'
+        assert [lib for lib, _ in parser_custom._ordered_strategies] == ['pdfplumber', 'pymupdf', 'pypdf2']
+
+    def test_lightweight_parse(self, tmp_path):
+        """Test that lightweight parsing keeps text only and lists images on demand."""
+        import fitz
+        from pdf2latex.pdf_parser import PDFParser
+
+        pdf_path = tmp_path / "doc.pdf"
+        doc = fitz.open()
+        for n in range(3):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {n + 1} text", fontsize=12)
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), 0)
+        pixmap.clear_with(255)
+        doc[1].insert_image(fitz.Rect(72, 100, 144, 172), pixmap=pixmap)
+        doc.save(pdf_path)
+        doc.close()
+
+        parser = PDFParser(config={'lightweight': True})
+        document = parser.parse(pdf_path)
+
+        pages = document['pages']
+        assert [page['page_number'] for page in pages] == [1, 2, 3]
+        assert all(set(page) == {'page_number', 'text', 'text_dict'} for page in pages)
+        assert 'Page 2 text' in pages[1]['text']
+        assert pages[0]['text_dict'] is not None and pages[1]['text_dict'] is None
+
+        images = parser.get_page_images(pdf_path, 2)
+        assert len(images) == 1 and images[0]['width'] == 8
+        assert parser.get_page_images(pdf_path, 1) == []
+        assert parser.get_page_images(pdf_path, 4) == []
+
+    def test_parallel_text_extraction(self, tmp_path):
+        """Test that extracting page text in worker processes keeps the order and output."""
+        import fitz
+        from pdf2latex.pdf_parser import PDFParser
+
+        pdf_path = tmp_path / "doc.pdf"
+        doc = fitz.open()
+        for n in range(20):
+            doc.new_page().insert_text((72, 72), f"Text on page {n + 1}", fontsize=12)
+        doc.save(pdf_path)
+        doc.close()
+
+        serial = PDFParser(config={'lightweight': True}).parse(pdf_path)
+        parallel = PDFParser(config={'lightweight': True, 'parse_workers': 2}).parse(pdf_path)
+
+        assert [page['text'] for page in parallel['pages']] == [page['text'] for page in serial['pages']]
+        assert 'Text on page 20' in parallel['pages'][19]['text']
 
 
 class TestLaTeXGenerator:
@@ -75,6 +155,8 @@ class TestLaTeXGenerator:
         assert generator._escape_latex("100% sure") == "100\\% sure"
         assert generator._escape_latex("$money$") == "\\$money\\$"
         assert generator._escape_latex("C#") == "C\\#"
+        assert generator._escape_latex("a\\b") == "a\\textbackslash{}b"
+        assert generator._escape_latex("x^2") == "x\\textasciicircum{}2"
     
     def test_generate_preamble(self):
         """Test preamble generation."""
@@ -89,7 +171,7 @@ class TestLaTeXGenerator:
             }
         }
         
-        preamble = generator._generate_preamble(document)
+        preamble = generator.generate(document)
         
         assert '\\documentclass{article}' in preamble
         assert '\\title{Test Document}' in preamble
@@ -109,6 +191,64 @@ class TestLaTeXGenerator:
         assert "This is a test paragraph." in formatted
         assert "This is another paragraph." in formatted
 
+    def test_filter_single_line_metadata_date_components(self):
+        """Test that date patterns are removed one after another."""
+        from pdf2latex.latex_generator import LaTeXGenerator
+
+        generator = LaTeXGenerator(preserve_images=False)
+
+        # A numeric date is removed before the month-year pattern gets to split it
+        assert generator._filter_single_line_metadata(
+            'Quarterly Report John Smith March 2024-03-31 Revenue grew',
+            'Quarterly Report', 'John Smith', 'March 31, 2024'
+        ) == 'March Revenue grew'
+
+        # Removing the numeric date joins a month and year that are removed next
+        assert generator._filter_single_line_metadata(
+            'Lab Notes Jane Doe Issued June 05/06/2024 2024 final',
+            'Lab Notes', 'Jane Doe', 'June 5, 2024'
+        ) == 'Issued final'
+
+    def test_generate_to_stream(self):
+        """Test that streaming generation matches the returned document."""
+        import io
+        from pdf2latex.latex_generator import LaTeXGenerator
+
+        generator = LaTeXGenerator(preserve_images=False)
+
+        document = {
+            'metadata': {'title': 'Test Document'},
+            'pages': [
+                {'text': 'First page.'},
+                {'text': '   '},
+                {'text': 'Third page.'}
+            ]
+        }
+
+        buffer = io.StringIO()
+        generator.generate_to(document, buffer)
+
+        assert buffer.getvalue() == generator.generate(document)
+        assert buffer.getvalue().endswith('Third page.\n\n\\end{document}')
+        assert buffer.getvalue().count('\\newpage') == 2
+
+    def test_generate_with_worker_processes(self):
+        """Test that formatting pages in worker processes keeps the output unchanged."""
+        from pdf2latex.latex_generator import LaTeXGenerator
+
+        document = {
+            'metadata': {'title': 'Test Document'},
+            'pages': [
+                {'text': f'{n}. Section Title\n\nBody text on page {n} with x² = y.'}
+                for n in range(1, 13)
+            ]
+        }
+
+        sequential = LaTeXGenerator(preserve_images=False)
+        parallel = LaTeXGenerator(preserve_images=False, config={'max_workers': 2})
+
+        assert parallel.generate(document) == sequential.generate(document)
+
 
 if __name__ == '__main__':
     # Run tests
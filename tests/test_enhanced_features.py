@@ -2,6 +2,7 @@
 Tests for enhanced mathematical expression and image processing features.
 """
 
+import os
 import pytest
 from pathlib import Path
 import sys
@@ -9,8 +10,9 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from pdf2latex.math_processor import MathProcessor
+from pdf2latex.math_processor import MathProcessor, _is_likely_math_line
 from pdf2latex.image_processor import ImageProcessor
+from pdf2latex.latex_generator import LaTeXGenerator
 
 
 class TestMathProcessor:
@@ -69,6 +71,9 @@ class TestMathProcessor:
         assert "pi" in result_pi
         result_omega = processor.convert_to_latex("Ω")
         assert "Omega" in result_omega
+        
+        # Commands are emitted with a single backslash
+        assert processor.convert_to_latex("α + β") == "\\alpha + \\beta"
     
     def test_mathematical_operators(self):
         """Test mathematical operator conversion."""
@@ -101,7 +106,13 @@ class TestMathProcessor:
         # Pythagorean theorem
         result = processor.convert_to_latex("a² + b² = c²")
         assert "a^{2} + b^{2} = c^{2}" in result
-    
+
+        # MOSFET drain current equation
+        result = processor.convert_to_latex("ID = 1 2µnCox W L (VGS -Vth)2")
+        assert result == "I_{D} = \\frac{1}{2}\\mu_{n} C_{ox} \\frac{W}{L}(V_{GS} - V_{th})^{2}"
+        result = processor.convert_to_latex("so ID = 1 2µnCox W L (VGS -Vth)2 in saturation")
+        assert result == "so I_{D} = \\frac{1}{2}\\mu_{n} C_{ox} \\frac{W}{L}(V_{GS} - V_{th})^{2} in saturation"
+
     def test_math_line_detection(self):
         """Test mathematical line detection."""
         processor = MathProcessor()
@@ -130,6 +141,45 @@ class TestMathProcessor:
         found_types = [expr['type'] for expr in expressions]
         assert 'expressions' in found_types or 'superscript' in found_types
 
+    def test_repeated_lines_use_cache(self):
+        """Test that repeated short lines are converted and classified from the cache."""
+        processor = MathProcessor()
+        _is_likely_math_line.cache_clear()
+
+        first = processor.convert_to_latex("x² + y² ≤ r²")
+        assert processor.convert_to_latex("x² + y² ≤ r²") == first
+        assert processor._convert_short.cache_info().hits == 1
+
+        # Long lines bypass the conversion cache
+        long_line = "x² " * 100
+        processor.convert_to_latex(long_line)
+        assert processor._convert_short.cache_info().currsize == 1
+
+        # Line classification is cached for every processor
+        detected = processor.is_likely_math_line("∑ x_i")
+        hits = _is_likely_math_line.cache_info().hits
+        assert processor.is_likely_math_line("∑ x_i") == detected
+        assert _is_likely_math_line.cache_info().hits == hits + 1
+
+    def test_convert_many_matches_single_lines(self):
+        """Test that batch conversion gives the same result as converting each line."""
+        processor = MathProcessor()
+        
+        # The first two lines would form one fraction if a match could cross lines
+        lines = ["sin(x", "y)/(z)", "x² + α", "plain text", "", "(a+b)/(c-d)"]
+        
+        assert processor.convert_many(lines) == [processor.convert_to_latex(line) for line in lines]
+        assert processor.convert_many([]) == []
+    
+    def test_convert_many_parallel_matches_serial(self):
+        """Test that converting chunks in worker processes keeps the order and output."""
+        processor = MathProcessor()
+        
+        lines = [f"x{n}² + α = {n}/{n + 1}" for n in range(40)]
+        
+        parallel = processor.convert_many_parallel(lines, max_workers=2, chunk_size=16)
+        assert parallel == processor.convert_many(lines)
+
 
 class TestImageProcessor:
     """Test the image processing functionality."""
@@ -237,5 +287,39 @@ class TestImageProcessor:
         test_file.unlink()
 
 
+class TestImageExtractionCache:
+    """Test reuse of extracted images across generate calls."""
+    
+    def test_images_extracted_once_per_unchanged_pdf(self, tmp_path, monkeypatch):
+        """Test that repeated generation does not re-extract images."""
+        generator = LaTeXGenerator(preserve_images=True, output_dir=tmp_path / "images")
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_text("placeholder")
+        
+        calls = []
+        
+        def fake_extract(path):
+            calls.append(path)
+            return {}
+        
+        monkeypatch.setattr(generator.image_processor, 'extract_all_images', fake_extract)
+        
+        document = {
+            'metadata': {},
+            'pages': [{'page_number': 1, 'text': 'Some text.'}],
+            'pdf_path': str(pdf_path)
+        }
+        
+        generator.generate(document)
+        generator.generate(document)
+        assert len(calls) == 1
+        
+        # A modified file must be extracted again
+        stat = pdf_path.stat()
+        os.utime(pdf_path, (stat.st_atime, stat.st_mtime + 10))
+        generator.generate(document)
+        assert len(calls) == 2
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
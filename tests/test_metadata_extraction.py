@@ -195,7 +195,19 @@ Abstract...''',
         assert structure['has_conclusion'] is True
         assert structure['has_references'] is True
         assert structure['estimated_type'] == 'academic_paper'
-    
+
+    def test_custom_patterns_are_used(self):
+        """Test that pattern lists changed on an instance replace the defaults."""
+        extractor = MetadataExtractor()
+        extractor.date_patterns = [r'issued (\d{4})']
+        extractor.structure_keywords['references'] = r'(?i)\bsources\b'
+
+        text = 'Published: 1999\nIssued 2021\n\nSources\n[1] Smith, J.'
+
+        assert extractor._detect_date(text, text) == '2021'
+        assert extractor._analyze_document_structure(text)['has_references'] is True
+        assert self.extractor._analyze_document_structure(text)['has_references'] is False
+
     def test_existing_metadata_preservation(self):
         """Test that existing metadata is preserved and enhanced."""
         document = {
@@ -354,6 +366,49 @@ The field has evolved significantly...''',
         assert 'diagnostic accuracy' in abstract_text
         assert len(abstract_text) > 50
 
+    def test_abstract_extraction_ignores_page_body(self):
+        """Test that only the top of the first page is searched for the abstract."""
+        body = 'The healthcare industry has undergone rapid change. ' * 200
+        document = {
+            'metadata': {'structure': {'has_abstract': True}},
+            'pages': [{
+                'text': ('Research Paper Title\n\nAbstract\n'
+                         'This comprehensive study examines the impact of artificial intelligence '
+                         'on modern healthcare systems.\n\nIntroduction\n' + body +
+                         '\nSummary\nA late summary that is far too deep into the page to be '
+                         'treated as the abstract of the paper.\nIntroduction\n'),
+                'page_number': 1
+            }],
+            'page_count': 1
+        }
+
+        abstract_text = self.generator._extract_abstract(document)
+
+        assert abstract_text is not None
+        assert 'comprehensive study examines' in abstract_text
+
+        # An abstract-like section below the window is not picked up
+        document['pages'][0]['text'] = 'Research Paper Title\n\n' + body + document['pages'][0]['text'][-120:]
+        assert self.generator._extract_abstract(document) is None
+
+    def test_long_abstract_extends_past_search_window(self):
+        """Test that an abstract starting near the top may end beyond the search window."""
+        long_abstract = 'This study examines the impact of machine learning on diagnosis. ' * 80
+        document = {
+            'metadata': {'structure': {'has_abstract': True}},
+            'pages': [{
+                'text': ('Research Paper Title\nJane Doe, John Smith\n\nAbstract\n' + long_abstract +
+                         '\nIntroduction\nThe field has evolved significantly.'),
+                'page_number': 1
+            }],
+            'page_count': 1
+        }
+        assert len(long_abstract) > 4096
+
+        abstract_text = self.generator._extract_abstract(document)
+
+        assert abstract_text == ' '.join(long_abstract.split())[:1000]
+
 
 def test_integration_metadata_and_latex():
     """Integration test for metadata extraction and LaTeX generation."""